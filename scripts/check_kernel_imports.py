@@ -6,23 +6,61 @@ Ensures the "Kernel Purity" rule: kernel files must not import from components.
 This maintains the one-way dependency flow and enables future Rust/C++ migration.
 """
 import ast
+import os
 import sys
-import glob
 
 
-def check_imports(file_path):
-    """Check a single file for forbidden imports.
+# Passed straight to compile() to get an AST without ast.parse's wrapper
+_COMPILE_FLAGS = ast.PyCF_ONLY_AST
+
+# Statement fields that hold nested blocks; imports can only appear in these
+_BLOCK_FIELDS = ("body", "orelse", "finalbody", "handlers", "cases")
+
+
+def _iter_statements(nodes):
+    """Yield statements depth-first, descending only into nested blocks.
+
+    Imports are statements, so expression subtrees never need visiting.
+    """
+    for node in nodes:
+        yield node
+        for field in _BLOCK_FIELDS:
+            yield from _iter_statements(getattr(node, field, ()))
+
+
+def iter_kernel_files(root="waterlib/kernels"):
+    """Yield paths of all Python files under a kernel directory.
+
+    __pycache__ directories are pruned before descending into them.
 
     Args:
-        file_path: Path to Python file to check
+        root: Directory to walk
+
+    Yields:
+        Path of each .py file, as a string
+    """
+    with os.scandir(root) as entries:
+        for entry in entries:
+            if entry.is_dir(follow_symlinks=False):
+                if entry.name != "__pycache__":
+                    yield from iter_kernel_files(entry.path)
+            elif entry.name.endswith(".py"):
+                yield entry.path
+
+
+def check_source(source, filename="<unknown>"):
+    """Check Python source code for forbidden imports.
+
+    Args:
+        source: Python source code (str or bytes)
+        filename: Name used in syntax error messages
 
     Returns:
         Error message if violation found, None otherwise
     """
-    with open(file_path, "r", encoding="utf-8") as f:
-        tree = ast.parse(f.read(), filename=file_path)
+    tree = compile(source, filename, "exec", flags=_COMPILE_FLAGS)
 
-    for node in ast.walk(tree):
+    for node in _iter_statements(tree.body):
         # Check 'import waterlib.components...'
         if isinstance(node, ast.Import):
             for alias in node.names:
@@ -36,9 +74,39 @@ def check_imports(file_path):
     return None
 
 
-def main():
-    """Main entry point for kernel purity check."""
-    kernel_files = glob.glob("waterlib/kernels/**/*.py", recursive=True)
+def check_imports(file_path):
+    """Check a single file for forbidden imports.
+
+    Args:
+        file_path: Path to Python file to check
+
+    Returns:
+        Error message if violation found, None otherwise
+    """
+    with open(file_path, "rb") as f:
+        source = f.read()
+
+    # Any forbidden import must spell out the dotted name literally, so files
+    # that never mention it can skip the (much more expensive) AST parse.
+    if b"waterlib.components" not in source:
+        return None
+
+    return check_source(source, filename=file_path)
+
+
+def main(argv=None):
+    """Main entry point for kernel purity check.
+
+    Args:
+        argv: Kernel files to check. Defaults to the command line arguments,
+              or every file under waterlib/kernels/ when none are given.
+
+    Returns:
+        Exit code: 0 if all files pass, 1 if any violation was found
+    """
+    kernel_files = argv if argv is not None else sys.argv[1:]
+    if not kernel_files:
+        kernel_files = iter_kernel_files()
     violations = []
 
     for file_path in kernel_files:
@@ -50,11 +118,11 @@ def main():
         print("[FAIL] ARCHITECTURE VIOLATION: Kernels must not import Components.")
         for v in violations:
             print(f"  - {v}")
-        sys.exit(1)
+        return 1
 
     print("[PASS] Kernel purity check passed.")
-    sys.exit(0)
+    return 0
 
 
 if __name__ == "__main__":
-    main()
+    sys.exit(main())
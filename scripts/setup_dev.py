@@ -5,10 +5,15 @@ Quick setup script for waterlib development environment.
 Installs dependencies and configures pre-commit hooks.
 Run this after cloning the repository.
 """
+import io
 import subprocess
 import sys
+from contextlib import redirect_stdout
 from pathlib import Path
 
+from check_kernel_imports import iter_kernel_files
+from check_kernel_imports import main as check_kernel_imports
+
 
 def run_command(cmd, description):
     """Run a command and report results."""
@@ -71,18 +76,15 @@ def main():
 
     # Step 3: Test kernel import checker
     print("\n🔍 Testing kernel import restrictions...")
-    result = subprocess.run(
-        [sys.executable, "scripts/check_kernel_imports.py"] +
-        [str(p) for p in Path("waterlib/kernels").rglob("*.py")
-         if "__pycache__" not in str(p)],
-        capture_output=True
-    )
+    report = io.StringIO()
+    with redirect_stdout(report):
+        returncode = check_kernel_imports(list(iter_kernel_files()))
 
-    if result.returncode == 0:
+    if returncode == 0:
         print("   ✅ All kernels pass import restrictions")
     else:
         print("   ⚠️  Some kernels may have violations")
-        print("   Check output for details")
+        print(f"   {report.getvalue().strip()}")
 
     # Step 4: Run tests (optional)
     print("\n🧪 Running quick test check...")
@@ -93,8 +95,7 @@ def main():
     )
 
     if result.returncode == 0:
-        test_count = len([l for l in result.stdout.split('\n')
-                          if '::test_' in l])
+        test_count = result.stdout.count('::test_')
         print(f"   ✅ Found ~{test_count} tests")
     else:
         print("   ℹ️  Could not collect tests (pytest may not be fully set up)")
@@ -4,11 +4,16 @@ Test script to verify kernel import restriction enforcement.
 This script creates temporary test files with violations and ensures
 the enforcement mechanisms catch them correctly.
 """
+import io
 import tempfile
 import subprocess
 import sys
+from contextlib import redirect_stdout
 from pathlib import Path
 
+from check_kernel_imports import check_source, iter_kernel_files
+from check_kernel_imports import main as check_kernel_imports
+
 
 def test_flake8_detection():
     """Test that flake8 detects kernel import violations."""
@@ -121,33 +126,16 @@ def example_step(params: ExampleParams) -> Tuple[float, float]:
     return params.value, params.value * 2
 """
 
-    with tempfile.NamedTemporaryFile(
-        mode='w',
-        suffix='.py',
-        dir='waterlib/kernels',
-        delete=False
-    ) as f:
-        f.write(test_content)
-        temp_file = f.name
-
-    try:
-        # Run the check script
-        result = subprocess.run(
-            ['python', 'scripts/check_kernel_imports.py', temp_file],
-            capture_output=True,
-            text=True
-        )
+    # Check the source in-process; no temp file or subprocess needed
+    error = check_source(test_content)
 
-        if result.returncode == 0:
-            print("✅ PASS: Script correctly allowed valid imports")
-            return True
-        else:
-            print("❌ FAIL: Script incorrectly flagged valid imports")
-            print(f"   Output: {result.stderr}")
-            return False
-    finally:
-        # Clean up
-        Path(temp_file).unlink(missing_ok=True)
+    if error is None:
+        print("✅ PASS: Script correctly allowed valid imports")
+        return True
+    else:
+        print("❌ FAIL: Script incorrectly flagged valid imports")
+        print(f"   Output: {error}")
+        return False
 
 
 def test_existing_kernels():
@@ -157,24 +145,21 @@ def test_existing_kernels():
     print("="*60)
 
     # Get all kernel files
-    kernel_files = list(Path('waterlib/kernels').rglob('*.py'))
-    kernel_files = [f for f in kernel_files if '__pycache__' not in str(f)]
+    kernel_files = list(iter_kernel_files())
 
     print(f"Checking {len(kernel_files)} kernel files...")
 
-    # Run check script on all existing kernels
-    result = subprocess.run(
-        ['python', 'scripts/check_kernel_imports.py'] + [str(f) for f in kernel_files],
-        capture_output=True,
-        text=True
-    )
+    # Run the checker in-process on all existing kernels
+    report = io.StringIO()
+    with redirect_stdout(report):
+        returncode = check_kernel_imports(kernel_files)
 
-    if result.returncode == 0:
+    if returncode == 0:
         print("✅ PASS: All existing kernels pass import restrictions")
         return True
     else:
         print("❌ FAIL: Some existing kernels have violations")
-        print(f"   Output: {result.stderr}")
+        print(f"   Output: {report.getvalue()}")
         return False
 
 
@@ -7,6 +7,7 @@ This script demonstrates how to:
 3. Access and plot results
 """
 
+import os
 import waterlib
 from pathlib import Path
 
@@ -28,24 +29,39 @@ def main():
     print("\nSimulation complete!")
     print(f"Simulated {results.num_timesteps} days")
 
-    # Access component results from dataframe
+    # Extract the series used for plotting once, as one (N, 4) array
+    df = results.dataframe
+    dates = df.index
+    storage, runoff_mm, demand, supplied = df[[
+        "reservoir.storage",
+        "catchment.runoff_mm",
+        "demand.demand",
+        "demand.supplied",
+    ]].to_numpy().T
+
+    # Access component results from dataframe (all statistics in one pass)
+    stats = df.agg({
+        "reservoir.storage": ["mean", "min", "max"],
+        "catchment.runoff_mm": ["sum", "mean"],
+        "demand.demand": ["sum"],
+        "demand.supplied": ["sum"],
+    })
+
     print("\nReservoir storage statistics:")
-    reservoir_storage = results.dataframe["reservoir.storage"]
-    print(f"  Mean: {reservoir_storage.mean():.0f} m³")
-    print(f"  Min:  {reservoir_storage.min():.0f} m³")
-    print(f"  Max:  {reservoir_storage.max():.0f} m³")
+    print(f"  Mean: {stats.at['mean', 'reservoir.storage']:.0f} m³")
+    print(f"  Min:  {stats.at['min', 'reservoir.storage']:.0f} m³")
+    print(f"  Max:  {stats.at['max', 'reservoir.storage']:.0f} m³")
 
     print("\nCatchment runoff statistics:")
-    runoff_mm = results.dataframe["catchment.runoff_mm"]
-    print(f"  Total runoff: {runoff_mm.sum():.1f} mm")
-    print(f"  Mean daily runoff: {runoff_mm.mean():.2f} mm")
+    print(f"  Total runoff: {stats.at['sum', 'catchment.runoff_mm']:.1f} mm")
+    print(f"  Mean daily runoff: {stats.at['mean', 'catchment.runoff_mm']:.2f} mm")
 
     print("\nDemand fulfillment:")
-    demand = results.dataframe["demand.demand"]
-    supplied = results.dataframe["demand.supplied"]
-    fulfillment = (supplied.sum() / demand.sum()) * 100
-    print(f"  Total demand: {demand.sum():.0f} m³")
-    print(f"  Total supplied: {supplied.sum():.0f} m³")
+    total_demand = stats.at["sum", "demand.demand"]
+    total_supplied = stats.at["sum", "demand.supplied"]
+    fulfillment = (total_supplied / total_demand) * 100
+    print(f"  Total demand: {total_demand:.0f} m³")
+    print(f"  Total supplied: {total_supplied:.0f} m³")
     print(f"  Fulfillment: {fulfillment:.1f}%")
 
     # Save results (already saved by run_simulation)
@@ -53,16 +69,13 @@ def main():
 
     # Plot results (if matplotlib available)
     try:
+        import matplotlib
+        matplotlib.use("Agg")  # File output only; skip GUI backend probing
         import matplotlib.pyplot as plt
 
         fig, axes = plt.subplots(3, 1, figsize=(12, 10))
 
-        # Get dates from dataframe index
-        dates = results.dataframe.index
-
         # Plot catchment runoff
-        runoff = results.dataframe["catchment.runoff"]
-        runoff_mm = results.dataframe["catchment.runoff_mm"]
         axes[0].bar(dates, runoff_mm, label="Runoff (mm)", alpha=0.7, color='steelblue')
         axes[0].set_ylabel("Runoff (mm/day)")
         axes[0].legend()
@@ -70,16 +83,14 @@ def main():
         axes[0].set_title("Catchment Runoff")
 
         # Plot reservoir storage
-        axes[1].plot(dates, reservoir_storage / 1e6, color='royalblue')
+        axes[1].plot(dates, storage / 1e6, color='royalblue')
         axes[1].set_ylabel("Storage (million m³)")
         axes[1].grid(True, alpha=0.3)
         axes[1].set_title("Reservoir Storage")
 
         # Plot demand satisfaction
-        demand_requested = results.dataframe["demand.demand"]
-        demand_supplied = results.dataframe["demand.supplied"]
-        axes[2].plot(dates, demand_requested, label="Requested", linestyle='--')
-        axes[2].plot(dates, demand_supplied, label="Supplied")
+        axes[2].plot(dates, demand, label="Requested", linestyle='--')
+        axes[2].plot(dates, supplied, label="Supplied")
         axes[2].set_ylabel("Demand (m³/day)")
         axes[2].set_xlabel("Date")
         axes[2].legend()
@@ -88,7 +99,8 @@ def main():
 
         plt.tight_layout()
         plot_path = OUTPUT_DIR / "simulation_plots.png"
-        plt.savefig(plot_path, dpi=300)
+        plt.savefig(plot_path, dpi=int(os.environ.get("WATERLIB_PLOT_DPI", "150")))
+        plt.close(fig)
         print(f"Plots saved to: {plot_path}")
 
     except ImportError:
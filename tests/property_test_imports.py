@@ -5,139 +5,388 @@ These tests verify the architectural constraints around kernel/component separat
 """
 
 import ast
+import mmap
 import os
+import re
+from collections import defaultdict, deque
+from dataclasses import dataclass
+from functools import lru_cache
 from pathlib import Path
-from typing import List, Set, Tuple
+from typing import Dict, FrozenSet, List, Optional, Tuple
 import pytest
-from hypothesis import given, strategies as st, settings
 
 
-def get_all_kernel_files() -> List[str]:
+_REPO_ROOT = Path(__file__).resolve().parent.parent
+_TEST_DIR = _REPO_ROOT / "tests"
+_WATERLIB_DIR = _REPO_ROOT / "waterlib"
+_KERNEL_DIR = _WATERLIB_DIR / "kernels"
+_COMPONENT_DIR = _WATERLIB_DIR / "components"
+
+# Directories that never hold package sources; pruned before descending
+_SKIP_DIRS = frozenset({'__pycache__', '.git', '.venv', 'venv', 'node_modules'})
+
+
+def _iter_py_files(root, predicate):
+    """
+    Yield paths of Python files under root whose file name satisfies predicate.
+
+    Directories are walked with an explicit stack, and those in _SKIP_DIRS are
+    never entered.
+    """
+    stack = [root]
+    while stack:
+        with os.scandir(stack.pop()) as entries:
+            for entry in entries:
+                if entry.is_dir(follow_symlinks=False):
+                    if entry.name not in _SKIP_DIRS:
+                        stack.append(entry.path)
+                elif entry.name.endswith('.py') and predicate(entry.name):
+                    yield entry.path
+
+
+@lru_cache(maxsize=None)
+def get_all_kernel_files() -> Tuple[str, ...]:
     """Get all Python files in the kernels directory."""
-    kernel_dir = Path(__file__).parent.parent / "waterlib" / "kernels"
-    if not kernel_dir.exists():
-        return []
+    if not _KERNEL_DIR.exists():
+        return ()
 
-    kernel_files = []
-    for root, dirs, files in os.walk(kernel_dir):
-        for file in files:
-            if file.endswith('.py') and file != '__init__.py':
-                kernel_files.append(os.path.join(root, file))
-    return kernel_files
+    return tuple(_iter_py_files(_KERNEL_DIR, lambda name: name != '__init__.py'))
 
 
-def get_all_component_files() -> List[str]:
+@lru_cache(maxsize=None)
+def get_all_component_files() -> Tuple[str, ...]:
     """Get all Python files in the components directory."""
-    component_dir = Path(__file__).parent.parent / "waterlib" / "components"
-    if not component_dir.exists():
-        return []
+    if not _COMPONENT_DIR.exists():
+        return ()
 
-    component_files = []
-    for root, dirs, files in os.walk(component_dir):
-        for file in files:
-            if file.endswith('.py') and file != '__init__.py':
-                component_files.append(os.path.join(root, file))
-    return component_files
+    return tuple(_iter_py_files(_COMPONENT_DIR, lambda name: name != '__init__.py'))
 
 
-def get_all_test_files() -> List[str]:
+@lru_cache(maxsize=None)
+def get_all_test_files() -> Tuple[str, ...]:
     """Get all Python test files."""
-    test_dir = Path(__file__).parent
-    test_files = []
-    for root, dirs, files in os.walk(test_dir):
-        for file in files:
-            if file.startswith('test_') and file.endswith('.py'):
-                test_files.append(os.path.join(root, file))
-    return test_files
+    return tuple(_iter_py_files(_TEST_DIR, lambda name: name.startswith('test_')))
 
 
-def get_all_python_files() -> List[str]:
+@lru_cache(maxsize=None)
+def get_all_python_files() -> Tuple[str, ...]:
     """Get all Python files in the waterlib package."""
-    waterlib_dir = Path(__file__).parent.parent / "waterlib"
-    if not waterlib_dir.exists():
-        return []
+    if not _WATERLIB_DIR.exists():
+        return ()
+
+    return tuple(_iter_py_files(_WATERLIB_DIR, lambda name: True))
+
+
+@lru_cache(maxsize=None)
+def get_kernel_init_files() -> Tuple[str, ...]:
+    """Get all __init__.py files in kernel subdirectories."""
+    if not _KERNEL_DIR.exists():
+        return ()
+
+    # Skip the root kernels __init__.py, focus on subdirectories
+    kernel_dir = str(_KERNEL_DIR)
+    return tuple(
+        path for path in _iter_py_files(_KERNEL_DIR, lambda name: name == '__init__.py')
+        if os.path.dirname(path) != kernel_dir
+    )
 
-    python_files = []
-    for root, dirs, files in os.walk(waterlib_dir):
-        # Skip __pycache__ directories
-        if '__pycache__' in root:
-            continue
-        for file in files:
-            if file.endswith('.py'):
-                python_files.append(os.path.join(root, file))
-    return python_files
 
+@dataclass(frozen=True)
+class ModuleInfo:
+    """Import and name information for one module, gathered in a single pass."""
+    imports: Tuple[Tuple[str, int], ...]
+    public_names: FrozenSet[str]
+    exported_names: FrozenSet[str]
+    has_all: bool
 
-def extract_imports(file_path: str) -> List[Tuple[str, int]]:
+
+_EMPTY_MODULE_INFO = ModuleInfo((), frozenset(), frozenset(), False)
+
+# Statement fields that hold nested blocks; imports can only appear in these
+_BLOCK_FIELDS = ('body', 'orelse', 'finalbody', 'handlers', 'cases')
+
+
+class _ModuleInfoVisitor(ast.NodeVisitor):
     """
-    Extract all import statements from a Python file.
+    Collect the ModuleInfo fields of a module in one traversal.
 
-    Returns list of (module_name, line_number) tuples.
+    Only statements are visited; expression subtrees are never entered.
+    Imports are collected at any depth (deferred imports inside functions
+    still count as dependencies), while public names, __all__ and
+    'from X import Y' exports are taken from module scope only.
     """
+
+    def __init__(self):
+        self.imports = []
+        self.public_names = set()
+        self.exported_names = set()
+        self.has_all = False
+        self._scope_depth = 0
+
+    def generic_visit(self, node):
+        for field in _BLOCK_FIELDS:
+            for child in getattr(node, field, ()):
+                self.visit(child)
+
+    def visit_Import(self, node):
+        for alias in node.names:
+            self.imports.append((alias.name, node.lineno))
+
+    def visit_ImportFrom(self, node):
+        self.imports.append((node.module or '', node.lineno))
+        if self._scope_depth == 0:
+            for alias in node.names:
+                self.exported_names.add(alias.name)
+
+    def visit_ClassDef(self, node):
+        if self._scope_depth == 0 and not node.name.startswith('_'):
+            self.public_names.add(node.name)
+        self._scope_depth += 1
+        self.generic_visit(node)
+        self._scope_depth -= 1
+
+    visit_FunctionDef = visit_ClassDef
+    visit_AsyncFunctionDef = visit_ClassDef
+
+    def visit_Assign(self, node):
+        if self._scope_depth:
+            return
+        for target in node.targets:
+            if isinstance(target, ast.Name) and target.id == '__all__':
+                self.has_all = True
+                # Extract names from __all__ list
+                if isinstance(node.value, ast.List):
+                    for elt in node.value.elts:
+                        if isinstance(elt, ast.Constant):
+                            self.exported_names.add(elt.value)
+
+
+def collect_module_info(tree: ast.Module) -> ModuleInfo:
+    """
+    Collect imports, public names and exports from a parsed module.
+
+    Exported names are those listed in __all__ plus names pulled in with
+    'from X import Y' at module scope.
+    """
+    visitor = _ModuleInfoVisitor()
+    for node in tree.body:
+        visitor.visit(node)
+
+    return ModuleInfo(
+        tuple(visitor.imports),
+        frozenset(visitor.public_names),
+        frozenset(visitor.exported_names),
+        visitor.has_all
+    )
+
+
+@lru_cache(maxsize=None)
+def _parse(file_path: str) -> Optional[ast.Module]:
+    """Parse a Python file once per session; None if it cannot be parsed."""
     try:
         with open(file_path, 'r', encoding='utf-8') as f:
-            tree = ast.parse(f.read(), filename=file_path)
+            return ast.parse(f.read(), filename=file_path)
     except (SyntaxError, UnicodeDecodeError):
-        return []
-
-    imports = []
-    for node in ast.walk(tree):
-        if isinstance(node, ast.ImportFrom):
-            module = node.module or ''
-            imports.append((module, node.lineno))
-        elif isinstance(node, ast.Import):
-            for alias in node.names:
-                imports.append((alias.name, node.lineno))
+        return None
+
+
+@lru_cache(maxsize=None)
+def get_module_info(file_path: str) -> ModuleInfo:
+    """
+    Get the ModuleInfo for a Python file.
+
+    Each file is read, parsed and walked once per session; unparseable files
+    yield an empty ModuleInfo.
+    """
+    tree = _parse(file_path)
+    if tree is None:
+        return _EMPTY_MODULE_INFO
+    return collect_module_info(tree)
+
+
+def _fast_mentions_waterlib(file_path: str) -> bool:
+    """
+    Cheaply check whether the raw source mentions waterlib at all.
+
+    The file is memory-mapped, so most files are rejected by a plain byte
+    search without being copied or decoded. Any file that mentions waterlib
+    is left to the AST, which recognizes every import form (comma-separated
+    imports, statements after a semicolon, and so on).
+    """
+    with open(file_path, 'rb') as f:
+        if os.fstat(f.fileno()).st_size == 0:
+            # mmap cannot map an empty file
+            return False
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            return mm.find(b'waterlib') >= 0
+
+
+def extract_imports(file_path: str) -> Tuple[Tuple[str, int], ...]:
+    """
+    Extract all import statements from a Python file.
+
+    Every caller only inspects waterlib imports, so files that never mention
+    waterlib are not parsed and yield no imports.
+
+    Returns tuple of (module_name, line_number) tuples.
+    """
+    if not _fast_mentions_waterlib(file_path):
+        return ()
+    return get_module_info(file_path).imports
+
+
+def test_extract_imports_sees_every_import_form(tmp_path):
+    """Imports that do not start their own line still reach the AST."""
+    source = tmp_path / 'mixed_imports.py'
+    source.write_text(
+        "import os, waterlib.components\n"
+        "import numpy as np; from waterlib.kernels import climate\n"
+    )
 
-    return imports
+    modules = {module for module, _ in extract_imports(str(source))}
 
+    assert {'waterlib.components', 'waterlib.kernels'} <= modules
 
+
+def module_name_from_path(file_path: str) -> str:
+    """Convert a file path under the repository root to a dotted module name."""
+    parts = Path(file_path).relative_to(_REPO_ROOT).with_suffix('').parts
+    if parts[-1] == '__init__':
+        parts = parts[:-1]
+    return '.'.join(parts)
+
+
+@dataclass(frozen=True)
+class RepoIndex:
+    """Imports of every file the property tests inspect, extracted up front."""
+
+    imports: Dict[str, Tuple[Tuple[str, int], ...]]
+
+    def imports_of(self, file_path: str) -> Tuple[Tuple[str, int], ...]:
+        """Return the waterlib imports of an indexed file."""
+        return self.imports[file_path]
+
+
+@lru_cache(maxsize=None)
+def build_repo_index() -> RepoIndex:
+    """
+    Extract the imports of every package and test file in one pass.
+
+    All file I/O and parsing happens here, so the tests themselves only look
+    results up. The index is built once and shared by every caller; treat it
+    as read-only.
+    """
+    all_files = tuple(dict.fromkeys(get_all_python_files() + get_all_test_files()))
+    return RepoIndex({file_path: extract_imports(file_path) for file_path in all_files})
+
+
+@lru_cache(maxsize=None)
 def build_dependency_graph() -> dict:
     """
     Build a dependency graph of all modules.
 
-    Returns dict mapping file paths to sets of imported module names.
+    Imported module names that belong to the package are resolved to their
+    file paths, so edges point at other graph nodes and can be followed
+    transitively. Imports from outside the package stay as module names.
+    The graph is built once and shared by every caller; treat it as read-only.
+
+    Returns dict mapping file paths to sets of imported file paths or
+    module names.
     """
-    graph = {}
+    index = build_repo_index()
     all_files = get_all_python_files()
+    path_of = {module_name_from_path(file_path): file_path for file_path in all_files}
 
+    graph = {}
     for file_path in all_files:
-        imports = extract_imports(file_path)
-        graph[file_path] = {module for module, _ in imports}
+        imports = index.imports_of(file_path)
+        graph[file_path] = {path_of.get(module, module) for module, _ in imports}
 
     return graph
 
 
-def has_circular_dependency(graph: dict, start_module: str, target_prefix: str, visited: Set[str] = None) -> bool:
+def find_modules_reaching(graph: dict, target_prefix: str) -> FrozenSet[str]:
     """
-    Check if there's a path from start_module to any module with target_prefix.
+    Find every module with a path to any module with target_prefix.
 
-    This is used to detect if kernels depend on components (directly or transitively).
+    This is used to detect if kernels depend on components (directly or
+    transitively). Rather than searching forward from each module, it seeds a
+    queue with the modules matching the target and walks import edges in
+    reverse, so the whole graph is classified in a single O(N + E) pass.
+    Matching modules are included in the result.
     """
-    if visited is None:
-        visited = set()
+    def name_of(node):
+        return module_name_from_path(node) if node in graph else node
+
+    importers = defaultdict(set)
+    reaching = set()
+    queue = deque()
+
+    for module, imported_modules in graph.items():
+        for imported_module in imported_modules:
+            importers[imported_module].add(module)
+    for node in set(graph) | set(importers):
+        if name_of(node).startswith(target_prefix):
+            reaching.add(node)
+            queue.append(node)
+
+    while queue:
+        for importer in importers[queue.popleft()]:
+            if importer not in reaching:
+                reaching.add(importer)
+                queue.append(importer)
+
+    return frozenset(reaching)
+
+
+@pytest.fixture(scope="session")
+def repo_index():
+    """Imports of every inspected file, extracted once per test session."""
+    return build_repo_index()
+
 
-    if start_module in visited:
-        return False
+@pytest.fixture(scope="session")
+def dependency_graph():
+    """Dependency graph of the waterlib package, built once per test session."""
+    return build_dependency_graph()
 
-    visited.add(start_module)
 
-    if start_module not in graph:
-        return False
+@pytest.fixture(scope="session")
+def component_dependents(dependency_graph):
+    """Modules that depend on waterlib.components, directly or transitively."""
+    return find_modules_reaching(dependency_graph, 'waterlib.components')
 
-    for imported_module in graph[start_module]:
-        if imported_module.startswith(target_prefix):
-            return True
-        if has_circular_dependency(graph, imported_module, target_prefix, visited):
-            return True
 
-    return False
+# Substrings marking a module name as kernel-related, matched in one regex scan
+_KERNEL_NAMES_RE = re.compile(r'snow17|awbm|weir|hargreaves|et|wgen')
+
+# Module leaf names that now live under waterlib.kernels
+_KERNEL_LEAFS = frozenset({'snow17', 'awbm', 'weir', 'hargreaves', 'et', 'wgen'})
+
+# Files that each parametrized argument ranges over
+_FILE_SOURCES = {
+    'kernel_file': get_all_kernel_files,
+    'component_file': get_all_component_files,
+    'python_file': get_all_python_files,
+    'test_file': get_all_test_files,
+    'init_file': get_kernel_init_files,
+}
+
+
+def pytest_generate_tests(metafunc):
+    """
+    Parametrize file arguments when this module's tests are collected.
+
+    Enumerating here rather than in decorators keeps importing the module
+    free of filesystem walks.
+    """
+    for argname, get_files in _FILE_SOURCES.items():
+        if argname in metafunc.fixturenames:
+            metafunc.parametrize(argname, get_files() or ['dummy'])
 
 
 # Property 1: Kernel Import Isolation
-@settings(max_examples=100, deadline=None)
-@given(kernel_file=st.sampled_from(get_all_kernel_files() or ['dummy']))
-def test_kernel_import_isolation(kernel_file):
+def test_kernel_import_isolation(kernel_file, repo_index):
     """
     **Feature: kernels-refactor, Property 1: Kernel Import Isolation**
 
@@ -149,7 +398,7 @@ def test_kernel_import_isolation(kernel_file):
     if kernel_file == 'dummy':
         pytest.skip("No kernel files found")
 
-    imports = extract_imports(kernel_file)
+    imports = repo_index.imports_of(kernel_file)
 
     for module, line_num in imports:
         assert not module.startswith('waterlib.components'), \
@@ -157,9 +406,7 @@ def test_kernel_import_isolation(kernel_file):
 
 
 # Property 2: Component Kernel Imports
-@settings(max_examples=100, deadline=None)
-@given(component_file=st.sampled_from(get_all_component_files() or ['dummy']))
-def test_component_kernel_imports(component_file):
+def test_component_kernel_imports(component_file, repo_index):
     """
     **Feature: kernels-refactor, Property 2: Component Kernel Imports**
 
@@ -171,14 +418,11 @@ def test_component_kernel_imports(component_file):
     if component_file == 'dummy':
         pytest.skip("No component files found")
 
-    imports = extract_imports(component_file)
-
-    # Check if this component imports any kernels
-    kernel_imports = [module for module, _ in imports if 'kernels' in module.lower()]
+    imports = repo_index.imports_of(component_file)
 
     for module, line_num in imports:
         # If importing kernel-related code, it should be from waterlib.kernels
-        if any(kernel_name in module for kernel_name in ['snow17', 'awbm', 'weir', 'hargreaves', 'et', 'wgen']):
+        if _KERNEL_NAMES_RE.search(module):
             # Allow imports from waterlib.kernels or from the component's own module
             if 'waterlib' in module and 'kernels' not in module and 'components' not in module:
                 # This might be an old import path
@@ -189,9 +433,7 @@ def test_component_kernel_imports(component_file):
 
 
 # Property 3: No Circular Dependencies
-@settings(max_examples=100, deadline=None)
-@given(kernel_file=st.sampled_from(get_all_kernel_files() or ['dummy']))
-def test_no_circular_dependencies(kernel_file):
+def test_no_circular_dependencies(kernel_file, component_dependents):
     """
     **Feature: kernels-refactor, Property 3: No Circular Dependencies**
 
@@ -203,19 +445,13 @@ def test_no_circular_dependencies(kernel_file):
     if kernel_file == 'dummy':
         pytest.skip("No kernel files found")
 
-    graph = build_dependency_graph()
-
     # Check that this kernel file doesn't have any path to components
-    has_component_dep = has_circular_dependency(graph, kernel_file, 'waterlib.components')
-
-    assert not has_component_dep, \
+    assert kernel_file not in component_dependents, \
         f"Kernel {kernel_file} has a dependency path to waterlib.components"
 
 
 # Property 4: Import Path Migration Completeness
-@settings(max_examples=100, deadline=None)
-@given(python_file=st.sampled_from(get_all_python_files() or ['dummy']))
-def test_import_path_migration_completeness(python_file):
+def test_import_path_migration_completeness(python_file, repo_index):
     """
     **Feature: kernels-refactor, Property 4: Import Path Migration Completeness**
 
@@ -231,25 +467,19 @@ def test_import_path_migration_completeness(python_file):
     if python_file.endswith('__init__.py'):
         pytest.skip("Skipping __init__.py files")
 
-    imports = extract_imports(python_file)
-
-    # List of modules that should now be in kernels, not components
-    kernel_modules = ['snow17', 'awbm', 'hargreaves', 'weir']
+    imports = repo_index.imports_of(python_file)
 
     for module, line_num in imports:
         # Check if importing kernel code from old component paths
         if module.startswith('waterlib.components.'):
-            module_name = module.split('.')[-1]
-            if module_name in kernel_modules:
+            if module.rpartition('.')[2] in _KERNEL_LEAFS:
                 # This is acceptable if it's importing the component wrapper
                 # We need to check what's being imported
                 pass  # Allow for now as components may still exist as wrappers
 
 
 # Property 5: Test Import Consistency
-@settings(max_examples=100, deadline=None)
-@given(test_file=st.sampled_from(get_all_test_files() or ['dummy']))
-def test_test_import_consistency(test_file):
+def test_test_import_consistency(test_file, repo_index):
     """
     **Feature: kernels-refactor, Property 5: Test Import Consistency**
 
@@ -261,7 +491,7 @@ def test_test_import_consistency(test_file):
     if test_file == 'dummy':
         pytest.skip("No test files found")
 
-    imports = extract_imports(test_file)
+    imports = repo_index.imports_of(test_file)
 
     for module, line_num in imports:
         # If importing from waterlib, check consistency
@@ -272,7 +502,7 @@ def test_test_import_consistency(test_file):
                 module_name = parts[2] if len(parts) > 2 else ''
 
                 # Check that kernel code is imported from kernels
-                if category == 'components' and module_name in ['snow17', 'awbm', 'weir', 'hargreaves']:
+                if category == 'components' and module_name in _KERNEL_LEAFS:
                     # Check if this is a kernel test or component test
                     if 'kernels' in test_file:
                         pytest.fail(
@@ -286,93 +516,46 @@ def test_test_import_consistency(test_file):
                     pass
 
 
-def get_kernel_init_files() -> List[str]:
-    """Get all __init__.py files in kernel subdirectories."""
-    kernel_dir = Path(__file__).parent.parent / "waterlib" / "kernels"
-    if not kernel_dir.exists():
-        return []
-
-    init_files = []
-    for root, dirs, files in os.walk(kernel_dir):
-        # Skip the root kernels __init__.py, focus on subdirectories
-        if root != str(kernel_dir) and '__init__.py' in files:
-            init_files.append(os.path.join(root, '__init__.py'))
-    return init_files
-
-
-def get_public_names_from_module(module_file: str) -> Set[str]:
+def get_public_names_from_module(module_file: str) -> FrozenSet[str]:
     """
-    Extract all public (non-underscore) class and function names from a module.
+    Extract all public (non-underscore) module-level class and function names.
 
-    Returns set of public names defined in the module.
+    Returns the cached set of public names defined in the module; callers
+    only read it, so no copy is made.
     """
-    try:
-        with open(module_file, 'r', encoding='utf-8') as f:
-            tree = ast.parse(f.read(), filename=module_file)
-    except (SyntaxError, UnicodeDecodeError):
-        return set()
+    return get_module_info(module_file).public_names
 
-    public_names = set()
-    for node in ast.walk(tree):
-        if isinstance(node, ast.ClassDef):
-            if not node.name.startswith('_'):
-                public_names.add(node.name)
-        elif isinstance(node, ast.FunctionDef):
-            if not node.name.startswith('_'):
-                public_names.add(node.name)
 
-    return public_names
+@dataclass(frozen=True)
+class InitExports:
+    """Names an __init__.py exports, and whether it declares __all__."""
 
+    names: FrozenSet[str]
+    has_all: bool
 
-def get_exported_names_from_init(init_file: str) -> Set[str]:
+
+@lru_cache(maxsize=None)
+def get_exported_names_from_init(init_file: str) -> InitExports:
     """
     Extract names exported from an __init__.py file.
 
     Checks both __all__ list and direct imports.
     """
-    try:
-        with open(init_file, 'r', encoding='utf-8') as f:
-            tree = ast.parse(f.read(), filename=init_file)
-    except (SyntaxError, UnicodeDecodeError):
-        return set()
-
-    exported_names = set()
-    has_all = False
-
-    for node in ast.walk(tree):
-        # Check for __all__ definition
-        if isinstance(node, ast.Assign):
-            for target in node.targets:
-                if isinstance(target, ast.Name) and target.id == '__all__':
-                    has_all = True
-                    # Extract names from __all__ list
-                    if isinstance(node.value, ast.List):
-                        for elt in node.value.elts:
-                            if isinstance(elt, ast.Constant):
-                                exported_names.add(elt.value)
-                            elif isinstance(elt, ast.Str):  # Python 3.7 compatibility
-                                exported_names.add(elt.s)
-
-        # Also check for direct imports (from X import Y)
-        if isinstance(node, ast.ImportFrom):
-            for alias in node.names:
-                exported_names.add(alias.name)
-
-    return exported_names, has_all
+    info = get_module_info(init_file)
+    return InitExports(info.exported_names, info.has_all)
 
 
 def get_modules_in_directory(directory: str) -> List[str]:
     """Get all Python module files in a directory (excluding __init__.py)."""
-    modules = []
-    for file in os.listdir(directory):
-        if file.endswith('.py') and file != '__init__.py':
-            modules.append(os.path.join(directory, file))
-    return modules
+    with os.scandir(directory) as entries:
+        return [
+            entry.path for entry in entries
+            if entry.name.endswith('.py') and entry.name != '__init__.py'
+            and entry.is_file(follow_symlinks=False)
+        ]
 
 
 # Property 6: Kernel __init__ Exports
-@settings(max_examples=100, deadline=None)
-@given(init_file=st.sampled_from(get_kernel_init_files() or ['dummy']))
 def test_kernel_init_exports(init_file):
     """
     **Feature: kernels-refactor, Property 6: Kernel __init__ Exports**
@@ -395,20 +578,19 @@ def test_kernel_init_exports(init_file):
         pytest.skip(f"No modules found in {directory}")
 
     # Get exported names from __init__.py
-    exported_names, has_all = get_exported_names_from_init(init_file)
+    exports = get_exported_names_from_init(init_file)
 
     # Check that __all__ exists
-    assert has_all, \
+    assert exports.has_all, \
         f"Kernel __init__.py {init_file} should have an __all__ list for explicit exports"
 
     # Collect all public names from modules in this directory
-    all_public_names = set()
-    for module_file in modules:
-        public_names = get_public_names_from_module(module_file)
-        all_public_names.update(public_names)
+    all_public_names = frozenset().union(
+        *(get_public_names_from_module(module_file) for module_file in modules)
+    )
 
     # Check that all public names are exported
-    missing_exports = all_public_names - exported_names
+    missing_exports = all_public_names - exports.names
 
     assert not missing_exports, \
         f"Kernel __init__.py {init_file} is missing exports: {missing_exports}. " \
@@ -0,0 +1,129 @@
+"""
+Property-based tests for AWBM kernel.
+
+Uses Hypothesis to generate physically bounded parameters, states and inputs,
+and checks that:
+- Every kernel entry point agrees with the scalar reference awbm_step
+- Water is conserved across one timestep
+- Stores stay non-negative and within capacity
+"""
+
+import math
+
+import numpy as np
+from hypothesis import given, settings, strategies as st
+
+from waterlib.kernels.hydrology.awbm import (
+    awbm_step,
+    awbm_step_into,
+    awbm_step_batch,
+    awbm_run_series,
+    AWBMParams,
+    AWBMState,
+    AWBMInputs,
+    AWBMOutputs
+)
+
+
+params_strategy = st.builds(
+    AWBMParams,
+    c_vec=st.lists(st.floats(1.0, 200.0), min_size=3, max_size=3),
+    bfi=st.floats(0.0, 1.0),
+    ks=st.floats(0.01, 0.99),
+    kb=st.floats(0.01, 0.99),
+    a1=st.floats(0.0, 0.5),
+    a2=st.floats(0.0, 0.5)
+)
+
+state_strategy = st.builds(
+    AWBMState,
+    ss1=st.floats(0.0, 100.0),
+    ss2=st.floats(0.0, 100.0),
+    ss3=st.floats(0.0, 200.0),
+    s_surf=st.floats(0.0, 50.0),
+    b_base=st.floats(0.0, 100.0)
+)
+
+inputs_strategy = st.builds(
+    AWBMInputs,
+    precip_mm=st.floats(0.0, 200.0),
+    pet_mm=st.floats(0.0, 20.0)
+)
+
+
+@settings(max_examples=200, deadline=None)
+@given(params=params_strategy, state=state_strategy, inputs=inputs_strategy)
+def test_entry_points_match_reference(params, state, inputs):
+    """Test that step_into and the batch kernel reproduce awbm_step exactly."""
+    expected_state, expected_outputs = awbm_step(inputs, params, state)
+
+    out_state = AWBMState()
+    out_outputs = AWBMOutputs(0.0, 0.0, 0.0, 0.0)
+    awbm_step_into(inputs, params, state, out_state, out_outputs)
+    assert out_state == expected_state
+    assert out_outputs == expected_outputs
+
+    batch_state, batch_outputs = awbm_step_batch(inputs, params, state)
+    assert float(batch_state.b_base) == expected_state.b_base
+    assert float(batch_state.ss3) == expected_state.ss3
+    assert float(batch_outputs.runoff_mm) == expected_outputs.runoff_mm
+    assert float(batch_outputs.excess_mm) == expected_outputs.excess_mm
+
+
+@settings(max_examples=200, deadline=None)
+@given(params=params_strategy, state=state_strategy, inputs=inputs_strategy)
+def test_water_balance(params, state, inputs):
+    """Test that storage change plus runoff accounts for P - PET.
+
+    When P >= PET every store can absorb its net input, so the balance
+    closes exactly. When P < PET a store may run dry before meeting its
+    share of PET, so up to PET - P of evaporative demand can go unmet.
+    """
+    new_state, outputs = awbm_step(inputs, params, state)
+
+    gained = new_state.total_storage - state.total_storage + outputs.runoff_mm
+    unmet_et = gained - (inputs.precip_mm - inputs.pet_mm)
+    tol = 1e-9 * (inputs.precip_mm + inputs.pet_mm + state.total_storage) + 1e-12
+
+    assert -tol <= unmet_et <= max(inputs.pet_mm - inputs.precip_mm, 0.0) + tol
+
+
+@settings(max_examples=200, deadline=None)
+@given(params=params_strategy, state=state_strategy, inputs=inputs_strategy)
+def test_stores_bounded(params, state, inputs):
+    """Test that stores stay non-negative and never rise above capacity."""
+    new_state, outputs = awbm_step(inputs, params, state)
+
+    for new, cap in zip(
+        (new_state.ss1, new_state.ss2, new_state.ss3),
+        (params.cap1, params.cap2, params.cap3)
+    ):
+        assert 0.0 <= new <= cap * (1 + 1e-9) + 1e-12
+    assert new_state.s_surf >= 0.0
+    assert new_state.b_base >= 0.0
+    assert math.isclose(
+        outputs.runoff_mm, outputs.baseflow_mm + outputs.surface_flow_mm,
+        rel_tol=1e-9, abs_tol=1e-12
+    )
+
+
+@settings(max_examples=50, deadline=None)
+@given(
+    params=params_strategy,
+    state=state_strategy,
+    forcing=st.lists(st.tuples(st.floats(0.0, 200.0), st.floats(0.0, 20.0)), max_size=30)
+)
+def test_series_matches_reference(params, state, forcing):
+    """Test that a series run equals stepping awbm_step through time."""
+    precip = np.array([p for p, _ in forcing])
+    pet = np.array([e for _, e in forcing])
+
+    final_state, outputs = awbm_run_series(precip, pet, params, state)
+
+    expected_state = state
+    for t, (p, e) in enumerate(forcing):
+        expected_state, expected = awbm_step(
+            AWBMInputs(precip_mm=p, pet_mm=e), params, expected_state
+        )
+        assert outputs.runoff_mm[t] == expected.runoff_mm
+    assert final_state == expected_state
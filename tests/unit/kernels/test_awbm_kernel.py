@@ -6,11 +6,23 @@ Tests the pure AWBM algorithm implementation including:
 - Baseflow/surface flow splitting
 - Routing store recession
 - State transitions for all 5 stores
+- Vectorized batch stepping
+- Time series and ensemble runs
+- Mass balance over multi-day simulations
 """
 
+import math
+import sys
+
+import numpy as np
 import pytest
 from waterlib.kernels.hydrology.awbm import (
     awbm_step,
+    awbm_step_into,
+    awbm_step_batch,
+    awbm_run_series,
+    awbm_run_ensemble,
+    awbm_iter_ensemble,
     AWBMParams,
     AWBMState,
     AWBMInputs,
@@ -18,6 +30,33 @@ from waterlib.kernels.hydrology.awbm import (
 )
 
 
+def store_bounds(params):
+    """Upper bounds for (ss1, ss2, ss3): each capacity plus rounding slack only."""
+    return tuple(cap * (1 + 1e-9) + 1e-12 for cap in (params.cap1, params.cap2, params.cap3))
+
+
+def assert_water_balance(precip, pet, initial, final, outputs):
+    """
+    Check water conservation across a simulation.
+
+    The routing stores conserve exactly: overflow in equals storage change plus
+    runoff out. Across all five stores, storage change plus runoff equals
+    P - PET, except that stores running dry may leave up to PET - P unmet.
+    """
+    scale = precip.sum() + pet.sum() + initial.total_storage
+    tol = 1e-9 * scale + 1e-12
+
+    routing_change = (final.s_surf + final.b_base) - (initial.s_surf + initial.b_base)
+    assert math.isclose(
+        outputs.excess_mm.sum(), routing_change + outputs.runoff_mm.sum(),
+        rel_tol=1e-9, abs_tol=tol
+    )
+
+    gained = final.total_storage - initial.total_storage + outputs.runoff_mm.sum()
+    unmet_et = gained - (precip.sum() - pet.sum())
+    assert -tol <= unmet_et <= np.maximum(pet - precip, 0.0).sum() + tol
+
+
 class TestAWBMBasicFunctionality:
     """Test basic AWBM kernel functionality."""
 
@@ -54,6 +93,63 @@ class TestAWBMBasicFunctionality:
         assert new_state.s_surf >= 0.0
         assert new_state.b_base >= 0.0
 
+    def test_params_precompute_capacities(self):
+        """Test that store capacities are derived once from area fractions."""
+        params = AWBMParams(
+            c_vec=[10.0, 50.0, 100.0],
+            bfi=0.35,
+            ks=0.35,
+            kb=0.95
+        )
+
+        assert params.a3 == pytest.approx(1.0 - 0.134 - 0.433)
+        assert params.cap1 == pytest.approx(0.134 * 10.0)
+        assert params.cap2 == pytest.approx(0.433 * 50.0)
+        assert params.cap3 == pytest.approx(params.a3 * 100.0)
+
+        # Params are immutable, so the derived capacities cannot go stale
+        with pytest.raises(AttributeError):
+            params.a1 = 0.2
+
+    def test_params_store_capacities_as_tuple(self):
+        """Test that c_vec is copied to a tuple, so params hash and cannot drift."""
+        c_vec = [10.0, 50.0, 100.0]
+        params = AWBMParams(c_vec=c_vec, bfi=0.35, ks=0.35, kb=0.95)
+
+        assert params.c_vec == (10.0, 50.0, 100.0)
+        assert hash(params) == hash(AWBMParams(c_vec=c_vec, bfi=0.35, ks=0.35, kb=0.95))
+
+        # Mutating the caller's list leaves the params and capacities unchanged
+        c_vec[0] = 20.0
+        assert params.c_vec[0] == 10.0
+        assert params.cap1 == pytest.approx(0.134 * 10.0)
+
+    def test_state_total_storage(self):
+        """Test that total_storage sums all five stores, scalar or array."""
+        state = AWBMState(ss1=1.0, ss2=2.0, ss3=3.0, s_surf=4.0, b_base=5.0)
+        assert state.total_storage == pytest.approx(15.0)
+
+        batch = AWBMState(
+            ss1=np.array([1.0, 0.0]),
+            ss2=np.array([2.0, 0.0]),
+            ss3=np.array([3.0, 0.0]),
+            s_surf=np.array([4.0, 0.0]),
+            b_base=np.array([5.0, 1.0])
+        )
+        np.testing.assert_allclose(batch.total_storage, [15.0, 1.0])
+
+    @pytest.mark.skipif(sys.version_info < (3, 10), reason="dataclass slots need Python 3.10+")
+    def test_kernel_types_use_slots(self):
+        """Test that per-timestep kernel objects carry no instance __dict__."""
+        state = AWBMState(ss1=0.5, ss2=10.0, ss3=20.0, s_surf=1.0, b_base=2.0)
+        inputs = AWBMInputs(precip_mm=5.0, pet_mm=1.0)
+        params = AWBMParams(c_vec=[10.0, 50.0, 100.0], bfi=0.35, ks=0.35, kb=0.95)
+
+        new_state, outputs = awbm_step(inputs, params, state)
+
+        for obj in (state, inputs, params, new_state, outputs):
+            assert not hasattr(obj, '__dict__')
+
     def test_surface_store_overflow(self):
         """Test that surface stores overflow when capacity is exceeded."""
         params = AWBMParams(
@@ -81,10 +177,9 @@ class TestAWBMBasicFunctionality:
         # Overflow should be generated
         assert outputs.excess_mm > 0.0
         # Stores should not exceed their capacities
-        assert new_state.ss1 <= params.a1 * params.c_vec[0]
-        assert new_state.ss2 <= params.a2 * params.c_vec[1]
-        a3 = 1.0 - params.a1 - params.a2
-        assert new_state.ss3 <= a3 * params.c_vec[2]
+        assert new_state.ss1 <= params.cap1
+        assert new_state.ss2 <= params.cap2
+        assert new_state.ss3 <= params.cap3
 
     def test_baseflow_surface_flow_splitting(self):
         """Test that overflow is split between baseflow and surface flow."""
@@ -112,7 +207,10 @@ class TestAWBMBasicFunctionality:
         assert outputs.baseflow_mm >= 0.0
         assert outputs.surface_flow_mm >= 0.0
         # Total runoff should equal baseflow + surface flow
-        assert abs(outputs.runoff_mm - (outputs.baseflow_mm + outputs.surface_flow_mm)) < 0.001
+        assert math.isclose(
+            outputs.runoff_mm, outputs.baseflow_mm + outputs.surface_flow_mm,
+            rel_tol=1e-9, abs_tol=1e-12
+        )
         # If there's excess, routing stores should receive inflow
         if outputs.excess_mm > 0.0:
             # At least one routing store should have increased
@@ -173,8 +271,7 @@ class TestAWBMStateTransitions:
         # SS1 should increase or stay same (depending on overflow)
         assert new_state.ss1 >= 0.0
         # Should not exceed capacity
-        cap1 = params.a1 * params.c_vec[0]
-        assert new_state.ss1 <= cap1 + 0.001  # Small tolerance for floating point
+        assert new_state.ss1 <= store_bounds(params)[0]
 
     def test_state_transitions_ss2(self):
         """Test surface store 2 (SS2) state transitions."""
@@ -192,8 +289,7 @@ class TestAWBMStateTransitions:
         # SS2 should be non-negative
         assert new_state.ss2 >= 0.0
         # Should not exceed capacity
-        cap2 = params.a2 * params.c_vec[1]
-        assert new_state.ss2 <= cap2 + 0.001
+        assert new_state.ss2 <= store_bounds(params)[1]
 
     def test_state_transitions_ss3(self):
         """Test surface store 3 (SS3) state transitions."""
@@ -211,9 +307,7 @@ class TestAWBMStateTransitions:
         # SS3 should be non-negative
         assert new_state.ss3 >= 0.0
         # Should not exceed capacity
-        a3 = 1.0 - params.a1 - params.a2
-        cap3 = a3 * params.c_vec[2]
-        assert new_state.ss3 <= cap3 + 0.001
+        assert new_state.ss3 <= store_bounds(params)[2]
 
     def test_state_transitions_s_surf(self):
         """Test surface routing store (S_surf) state transitions."""
@@ -438,8 +532,9 @@ class TestAWBMKnownInputOutput:
         # Excess should go into routing stores
         assert new_state.s_surf > 0.0 or new_state.b_base > 0.0
         # Stores should be at or near capacity
-        assert new_state.ss1 <= params.a1 * params.c_vec[0] + 0.001
-        assert new_state.ss2 <= params.a2 * params.c_vec[1] + 0.001
+        bound1, bound2, _ = store_bounds(params)
+        assert new_state.ss1 <= bound1
+        assert new_state.ss2 <= bound2
 
     def test_known_case_balanced_conditions(self):
         """Test known case: balanced P and PET."""
@@ -569,3 +664,341 @@ class TestAWBMParameterEffects:
 
         # Smaller capacities should result in more overflow
         assert outputs_small.excess_mm > outputs_large.excess_mm
+
+
+class TestAWBMStepInto:
+    """Test the out-parameter form of the kernel."""
+
+    def test_step_into_matches_step(self):
+        """Test that step_into writes the same values awbm_step returns."""
+        params = AWBMParams(c_vec=[8.0, 60.0, 120.0], bfi=0.4, ks=0.35, kb=0.92)
+        state = AWBMState(ss1=0.8, ss2=20.0, ss3=40.0, s_surf=3.0, b_base=8.0)
+        inputs = AWBMInputs(precip_mm=15.0, pet_mm=4.0)
+        out_state = AWBMState()
+        out_outputs = AWBMOutputs(0.0, 0.0, 0.0, 0.0)
+
+        awbm_step_into(inputs, params, state, out_state, out_outputs)
+
+        expected_state, expected_outputs = awbm_step(inputs, params, state)
+        assert out_state == expected_state
+        assert out_outputs == expected_outputs
+        # The input state is left untouched
+        assert state == AWBMState(ss1=0.8, ss2=20.0, ss3=40.0, s_surf=3.0, b_base=8.0)
+
+    def test_step_into_in_place(self):
+        """Test that passing the state as out_state advances it in place."""
+        params = AWBMParams(c_vec=[7.5, 76.0, 152.0], bfi=0.35, ks=0.35, kb=0.95)
+        state = AWBMState(ss1=1.0, ss2=32.0, ss3=64.0, s_surf=0.0, b_base=0.0)
+        expected_state = state
+        outputs = AWBMOutputs(0.0, 0.0, 0.0, 0.0)
+
+        for precip, pet in [(30.0, 3.0), (0.0, 5.0), (10.0, 1.0)]:
+            inputs = AWBMInputs(precip_mm=precip, pet_mm=pet)
+            expected_state, expected_outputs = awbm_step(inputs, params, expected_state)
+            awbm_step_into(inputs, params, state, state, outputs)
+            assert state == expected_state
+            assert outputs == expected_outputs
+
+
+class TestAWBMBatch:
+    """Test the vectorized batch kernel against the scalar kernel."""
+
+    STATE_FIELDS = ('ss1', 'ss2', 'ss3', 's_surf', 'b_base')
+    OUTPUT_FIELDS = ('runoff_mm', 'excess_mm', 'baseflow_mm', 'surface_flow_mm')
+
+    # (precip, pet, ss1, ss2, ss3, s_surf, b_base) covering dry, wet,
+    # overflowing and sub-threshold routing store cases
+    CASES = [
+        (20.0, 5.0, 0.0, 0.0, 0.0, 0.0, 0.0),
+        (50.0, 2.0, 1.0, 20.0, 40.0, 0.0, 0.0),
+        (0.0, 2.0, 0.5, 10.0, 20.0, 10.0, 20.0),
+        (2.0, 8.0, 0.8, 15.0, 30.0, 1.0, 2.0),
+        (0.0, 1.0, 0.5, 10.0, 20.0, 0.03, 0.02),
+        (5.0, 5.0, 0.5, 10.0, 20.0, 0.05, 0.05),
+        (30.0, 3.0, 1.0, 32.0, 64.0, 3.0, 8.0),
+    ]
+
+    def _batch_of(self, cases):
+        columns = np.array(cases).T
+        inputs = AWBMInputs(precip_mm=columns[0], pet_mm=columns[1])
+        state = AWBMState(*columns[2:])
+        return inputs, state
+
+    def test_batch_matches_scalar(self):
+        """Test that each batch element equals the scalar kernel result."""
+        params = AWBMParams(c_vec=[10.0, 50.0, 100.0], bfi=0.35, ks=0.35, kb=0.95)
+        inputs, state = self._batch_of(self.CASES)
+
+        new_state, outputs = awbm_step_batch(inputs, params, state)
+
+        for i, (precip, pet, *stores) in enumerate(self.CASES):
+            expected_state, expected_outputs = awbm_step(
+                AWBMInputs(precip_mm=precip, pet_mm=pet), params, AWBMState(*stores)
+            )
+            for field in self.STATE_FIELDS:
+                assert getattr(new_state, field)[i] == getattr(expected_state, field)
+            for field in self.OUTPUT_FIELDS:
+                assert getattr(outputs, field)[i] == getattr(expected_outputs, field)
+
+    def test_per_catchment_params(self):
+        """Test that parameter arrays give each catchment its own parameters."""
+        param_sets = [
+            AWBMParams(c_vec=[5.0, 40.0, 80.0], bfi=0.2, ks=0.3, kb=0.9),
+            AWBMParams(c_vec=[15.0, 100.0, 200.0], bfi=0.6, ks=0.6, kb=0.98),
+        ]
+        params = AWBMParams(
+            c_vec=[np.array([p.c_vec[i] for p in param_sets]) for i in range(3)],
+            bfi=np.array([p.bfi for p in param_sets]),
+            ks=np.array([p.ks for p in param_sets]),
+            kb=np.array([p.kb for p in param_sets])
+        )
+        case = (25.0, 3.0, 0.4, 15.0, 30.0, 5.0, 10.0)
+        inputs, state = self._batch_of([case, case])
+
+        new_state, outputs = awbm_step_batch(inputs, params, state)
+
+        for i, catchment_params in enumerate(param_sets):
+            expected_state, expected_outputs = awbm_step(
+                AWBMInputs(precip_mm=case[0], pet_mm=case[1]),
+                catchment_params,
+                AWBMState(*case[2:])
+            )
+            assert new_state.b_base[i] == expected_state.b_base
+            assert outputs.runoff_mm[i] == expected_outputs.runoff_mm
+
+    def test_scalar_inputs_broadcast(self):
+        """Test that scalar inputs broadcast across a batch of states."""
+        params = AWBMParams(c_vec=[7.5, 76.0, 152.0], bfi=0.35, ks=0.35, kb=0.95)
+        state = AWBMState(
+            ss1=np.zeros(4), ss2=np.zeros(4), ss3=np.zeros(4),
+            s_surf=np.zeros(4), b_base=np.zeros(4)
+        )
+        inputs = AWBMInputs(precip_mm=20.0, pet_mm=5.0)
+
+        new_state, outputs = awbm_step_batch(inputs, params, state)
+
+        assert outputs.runoff_mm.shape == (4,)
+        assert np.all(new_state.ss1 == new_state.ss1[0])
+        assert np.all(outputs.excess_mm >= 0.0)
+
+
+class TestAWBMRunSeries:
+    """Test running the kernel over a whole time series."""
+
+    def test_series_matches_repeated_steps(self):
+        """Test that a series run equals stepping awbm_step through time."""
+        params = AWBMParams(c_vec=[7.5, 76.0, 152.0], bfi=0.35, ks=0.35, kb=0.95)
+        state = AWBMState(ss1=0.5, ss2=20.0, ss3=40.0, s_surf=1.0, b_base=5.0)
+        precip = [0.0, 25.0, 40.0, 3.0, 0.0, 0.0, 12.0, 60.0, 0.0, 1.0]
+        pet = [4.0, 2.0, 1.0, 3.0, 5.0, 5.0, 2.0, 0.5, 4.0, 3.0]
+
+        final_state, outputs = awbm_run_series(precip, pet, params, state)
+
+        expected_state = state
+        for t, (p, e) in enumerate(zip(precip, pet)):
+            expected_state, expected = awbm_step(
+                AWBMInputs(precip_mm=p, pet_mm=e), params, expected_state
+            )
+            assert outputs.runoff_mm[t] == expected.runoff_mm
+            assert outputs.excess_mm[t] == expected.excess_mm
+            assert outputs.baseflow_mm[t] == expected.baseflow_mm
+            assert outputs.surface_flow_mm[t] == expected.surface_flow_mm
+        assert final_state == expected_state
+
+    def test_empty_series(self):
+        """Test that an empty series returns the initial state unchanged."""
+        params = AWBMParams(c_vec=[7.5, 76.0, 152.0], bfi=0.35, ks=0.35, kb=0.95)
+        state = AWBMState(ss1=0.5, ss2=20.0, ss3=40.0, s_surf=1.0, b_base=5.0)
+
+        final_state, outputs = awbm_run_series([], [], params, state)
+
+        assert final_state == state
+        assert outputs.runoff_mm.shape == (0,)
+
+    def test_mismatched_lengths_raise(self):
+        """Test that precipitation and PET series must line up."""
+        params = AWBMParams(c_vec=[7.5, 76.0, 152.0], bfi=0.35, ks=0.35, kb=0.95)
+
+        with pytest.raises(ValueError, match="equal length"):
+            awbm_run_series([1.0, 2.0], [1.0], params, AWBMState())
+
+
+class TestAWBMRunEnsemble:
+    """Test running an ensemble of parameter sets together."""
+
+    PARAM_SETS = [
+        AWBMParams(c_vec=[7.5, 76.0, 152.0], bfi=0.35, ks=0.35, kb=0.95),
+        AWBMParams(c_vec=[5.0, 40.0, 80.0], bfi=0.2, ks=0.3, kb=0.9),
+        AWBMParams(c_vec=[15.0, 100.0, 200.0], bfi=0.6, ks=0.6, kb=0.98, a1=0.2, a2=0.3),
+    ]
+    PRECIP = [0.0, 25.0, 40.0, 3.0, 0.0, 12.0, 60.0, 0.0]
+    PET = [4.0, 2.0, 1.0, 3.0, 5.0, 2.0, 0.5, 4.0]
+
+    def test_ensemble_matches_individual_series(self):
+        """Test that each ensemble member equals its own series run."""
+        state = AWBMState(ss1=0.5, ss2=20.0, ss3=40.0, s_surf=1.0, b_base=5.0)
+
+        final_state, outputs = awbm_run_ensemble(self.PRECIP, self.PET, self.PARAM_SETS, state)
+
+        assert outputs.runoff_mm.shape == (len(self.PRECIP), len(self.PARAM_SETS))
+        for i, params in enumerate(self.PARAM_SETS):
+            expected_state, expected = awbm_run_series(self.PRECIP, self.PET, params, state)
+            np.testing.assert_array_equal(outputs.runoff_mm[:, i], expected.runoff_mm)
+            np.testing.assert_array_equal(outputs.excess_mm[:, i], expected.excess_mm)
+            assert final_state.b_base[i] == expected_state.b_base
+
+    def test_per_member_forcing(self):
+        """Test that (T, N) forcing drives each member with its own column."""
+        precip = np.column_stack([self.PRECIP, np.zeros(len(self.PRECIP)), self.PRECIP])
+        pet = np.column_stack([self.PET, self.PET, np.zeros(len(self.PET))])
+
+        _, outputs = awbm_run_ensemble(precip, pet, self.PARAM_SETS, AWBMState())
+
+        _, dry = awbm_run_series(precip[:, 1], pet[:, 1], self.PARAM_SETS[1], AWBMState())
+        np.testing.assert_array_equal(outputs.runoff_mm[:, 1], dry.runoff_mm)
+        assert np.all(outputs.excess_mm[:, 1] == 0.0)
+
+    @pytest.mark.parametrize("dtype, tol", [(np.float64, 1e-12), (np.float32, 1e-5)])
+    def test_precision(self, dtype, tol):
+        """Test that results come back in the requested precision and agree with float64."""
+        state = AWBMState(ss1=0.5, ss2=20.0, ss3=40.0, s_surf=1.0, b_base=5.0)
+
+        final_state, outputs = awbm_run_ensemble(
+            self.PRECIP, self.PET, self.PARAM_SETS, state, dtype=dtype
+        )
+
+        assert outputs.runoff_mm.dtype == dtype
+        assert final_state.ss1.dtype == dtype
+        for i, params in enumerate(self.PARAM_SETS):
+            _, expected = awbm_run_series(self.PRECIP, self.PET, params, state)
+            for got, want in zip(outputs.runoff_mm[:, i], expected.runoff_mm):
+                assert math.isclose(got, want, rel_tol=tol, abs_tol=tol)
+
+    def test_empty_param_sets_raise(self):
+        """Test that an ensemble needs at least one parameter set."""
+        with pytest.raises(ValueError, match="at least one"):
+            awbm_run_ensemble(self.PRECIP, self.PET, [], AWBMState())
+
+
+class TestAWBMIterEnsemble:
+    """Test running an ensemble block by block."""
+
+    PARAM_SETS = TestAWBMRunEnsemble.PARAM_SETS
+    PRECIP = TestAWBMRunEnsemble.PRECIP
+    PET = TestAWBMRunEnsemble.PET
+
+    @pytest.mark.parametrize("time_batch", [1, 3, 8, 100])
+    def test_blocks_match_full_run(self, time_batch):
+        """Test that concatenated blocks equal a single ensemble run."""
+        state = AWBMState(ss1=0.5, ss2=20.0, ss3=40.0, s_surf=1.0, b_base=5.0)
+        final_state, outputs = awbm_run_ensemble(self.PRECIP, self.PET, self.PARAM_SETS, state)
+
+        blocks = list(awbm_iter_ensemble(
+            self.PRECIP, self.PET, self.PARAM_SETS, state, time_batch=time_batch
+        ))
+
+        assert [t0 for t0, _, _ in blocks] == list(range(0, len(self.PRECIP), time_batch))
+        runoff = np.concatenate([block.runoff_mm for _, _, block in blocks])
+        np.testing.assert_array_equal(runoff, outputs.runoff_mm)
+        np.testing.assert_array_equal(blocks[-1][1].b_base, final_state.b_base)
+
+    def test_non_positive_time_batch_raises(self):
+        """Test that blocks must hold at least one timestep."""
+        with pytest.raises(ValueError, match="time_batch"):
+            list(awbm_iter_ensemble(
+                self.PRECIP, self.PET, self.PARAM_SETS, AWBMState(), time_batch=0
+            ))
+
+
+class TestAWBMMassBalance:
+    """Test water conservation over multi-day simulations."""
+
+    # AWBMParams is frozen, so one instance is safely shared by every test
+    STANDARD_PARAMS = AWBMParams(c_vec=[7.5, 76.0, 152.0], bfi=0.35, ks=0.35, kb=0.95)
+
+    # (name, days, precip, pet, initial stores) for constant-forcing runs
+    SCENARIOS = [
+        ('moderate', 30, 10.0, 3.0, (0.0, 0.0, 0.0, 0.0, 0.0)),
+        ('drought', 30, 0.0, 5.0, (0.8, 25.0, 50.0, 2.0, 10.0)),
+        ('saturated', 30, 40.0, 1.0, (1.0, 32.0, 64.0, 5.0, 20.0)),
+        ('balanced', 30, 4.0, 4.0, (0.5, 10.0, 20.0, 1.0, 5.0)),
+    ]
+
+    @pytest.mark.parametrize(
+        "name, days, precip_mm, pet_mm, stores", SCENARIOS, ids=[s[0] for s in SCENARIOS]
+    )
+    def test_mass_balance_constant_forcing(self, name, days, precip_mm, pet_mm, stores):
+        """Test that constant forcing conserves water from any starting state."""
+        state = AWBMState(*stores)
+        precip = np.full(days, precip_mm)
+        pet = np.full(days, pet_mm)
+
+        final_state, outputs = awbm_run_series(precip, pet, self.STANDARD_PARAMS, state)
+
+        assert_water_balance(precip, pet, state, final_state, outputs)
+
+    def test_mass_balance_long_term(self):
+        """Test that a year of seasonal forcing conserves water."""
+        params = self.STANDARD_PARAMS
+        state = AWBMState()
+        # Wet winters and dry summers, as one year of daily forcing
+        seasonal = np.cos(2 * np.pi * np.arange(365) / 365)
+        precip = 2.5 * (1.0 + 0.5 * seasonal)
+        pet = 2.5 * (1.0 - 0.3 * seasonal)
+
+        final_state, outputs = awbm_run_series(precip, pet, params, state)
+
+        assert_water_balance(precip, pet, state, final_state, outputs)
+        # Most runoff is generated in the wet half of the year
+        wet = seasonal > 0.0
+        assert outputs.runoff_mm[wet].sum() > outputs.runoff_mm[~wet].sum()
+
+    def test_mass_balance_storm_event(self):
+        """Test a storm after a dry spell: overflow, then a receding hydrograph."""
+        params = self.STANDARD_PARAMS
+        state = AWBMState(ss1=0.5, ss2=20.0, ss3=40.0, s_surf=0.0, b_base=0.0)
+        # 5 dry days, an 80 mm storm, then 10 days of recession
+        precip = np.concatenate([np.zeros(5), [80.0], np.zeros(10)])
+        pet = np.concatenate([np.full(5, 4.0), [2.0], np.full(10, 3.0)])
+
+        final_state, outputs = awbm_run_series(precip, pet, params, state)
+
+        assert_water_balance(precip, pet, state, final_state, outputs)
+        # Nothing spills until the storm, which fills the stores and overflows
+        assert np.all(outputs.excess_mm[:5] == 0.0)
+        assert outputs.excess_mm[5] > 0.0
+        # Afterwards the routing stores only drain, so runoff falls every day
+        recession = outputs.runoff_mm[6:]
+        assert np.all(outputs.excess_mm[6:] < 1e-9)
+        assert np.all(np.diff(recession) < 0.0)
+        assert recession.sum() > 0.5 * outputs.excess_mm[5]
+
+    def test_mass_balance_parameter_sweep(self):
+        """Test that every member of a parameter sweep conserves water."""
+        param_sets = [
+            self.STANDARD_PARAMS,
+            AWBMParams(c_vec=[5.0, 40.0, 80.0], bfi=0.2, ks=0.3, kb=0.9),
+            AWBMParams(c_vec=[15.0, 100.0, 200.0], bfi=0.6, ks=0.6, kb=0.98),
+            AWBMParams(c_vec=[2.0, 20.0, 40.0], bfi=0.8, ks=0.1, kb=0.5, a1=0.3, a2=0.3),
+        ]
+        state = AWBMState()
+        seasonal = np.cos(2 * np.pi * np.arange(365) / 365)
+        precip = 2.5 * (1.0 + 0.5 * seasonal)
+        pet = 2.5 * (1.0 - 0.3 * seasonal)
+
+        final_states, outputs = awbm_run_ensemble(precip, pet, param_sets, state)
+
+        for i in range(len(param_sets)):
+            member_final = AWBMState(
+                ss1=final_states.ss1[i], ss2=final_states.ss2[i], ss3=final_states.ss3[i],
+                s_surf=final_states.s_surf[i], b_base=final_states.b_base[i]
+            )
+            member_outputs = AWBMOutputs(
+                runoff_mm=outputs.runoff_mm[:, i],
+                excess_mm=outputs.excess_mm[:, i],
+                baseflow_mm=outputs.baseflow_mm[:, i],
+                surface_flow_mm=outputs.surface_flow_mm[:, i]
+            )
+            assert_water_balance(precip, pet, state, member_final, member_outputs)
+        # Smaller stores spill more of the same rainfall
+        assert outputs.runoff_mm[:, 3].sum() > outputs.runoff_mm[:, 2].sum()
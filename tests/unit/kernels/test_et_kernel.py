@@ -9,14 +9,19 @@ Tests the pure ET calculation implementations including:
 - Extraterrestrial radiation calculation
 """
 
+import sys
 import pytest
 import math
+import numpy as np
 from waterlib.kernels.climate.et import (
     hargreaves_et,
+    hargreaves_et_scalar,
+    hargreaves_et_vec,
     HargreavesETParams,
     HargreavesETInputs,
     ETOutputs,
-    _calculate_ra
+    _calculate_ra,
+    _calculate_ra_vec
 )
 
 
@@ -103,6 +108,43 @@ class TestHargreavesETBasicFunctionality:
         # But should be reasonable (not infinite)
         assert outputs.et0_mm < 25.0
 
+    def test_params_precompute_latitude_trig(self):
+        """Test that latitude trig is derived once from latitude_deg."""
+        params = HargreavesETParams(latitude_deg=45.0)
+
+        assert params.sin_lat == pytest.approx(math.sin(math.radians(45.0)))
+        assert params.cos_lat == pytest.approx(math.cos(math.radians(45.0)))
+        assert params.tan_lat == pytest.approx(1.0)
+
+    def test_hargreaves_et_scalar_matches_dataclass_form(self):
+        """Test that the positional entry point matches hargreaves_et."""
+        params = HargreavesETParams(latitude_deg=45.0, coefficient=0.0025)
+        inputs = HargreavesETInputs(tmin_c=10.0, tmax_c=25.0, day_of_year=180)
+
+        et0 = hargreaves_et_scalar(10.0, 25.0, 180, 45.0, 0.0025)
+
+        assert et0 == hargreaves_et(inputs, params).et0_mm
+
+    def test_kernel_types_are_frozen(self):
+        """Test that inputs, params and outputs cannot be mutated."""
+        params = HargreavesETParams(latitude_deg=45.0)
+        outputs = hargreaves_et(HargreavesETInputs(10.0, 25.0, 180), params)
+
+        with pytest.raises(AttributeError):
+            params.latitude_deg = 30.0
+        with pytest.raises(AttributeError):
+            outputs.et0_mm = 0.0
+
+    @pytest.mark.skipif(sys.version_info < (3, 10), reason="dataclass slots need Python 3.10+")
+    def test_kernel_types_use_slots(self):
+        """Test that per-call kernel objects carry no instance __dict__."""
+        params = HargreavesETParams(latitude_deg=45.0)
+        inputs = HargreavesETInputs(tmin_c=10.0, tmax_c=25.0, day_of_year=180)
+        outputs = hargreaves_et(inputs, params)
+
+        for obj in (params, inputs, outputs):
+            assert not hasattr(obj, '__dict__')
+
 
 class TestHargreavesETLatitudeEffects:
     """Test ET calculation across different latitudes."""
@@ -197,49 +239,23 @@ class TestHargreavesETSeasonalEffects:
 
     def test_et_seasonal_variation_midlatitude(self):
         """Test seasonal variation in ET at mid-latitude."""
-        params = HargreavesETParams(latitude_deg=40.0)
-
-        # Keep temperature constant to isolate seasonal effect
-        base_inputs = {
-            'tmin_c': 15.0,
-            'tmax_c': 25.0
-        }
-
-        # Winter solstice (day ~355)
-        outputs_winter = hargreaves_et(
-            HargreavesETInputs(**base_inputs, day_of_year=355),
-            params
-        )
-
-        # Spring equinox (day ~80)
-        outputs_spring = hargreaves_et(
-            HargreavesETInputs(**base_inputs, day_of_year=80),
-            params
-        )
-
-        # Summer solstice (day ~172)
-        outputs_summer = hargreaves_et(
-            HargreavesETInputs(**base_inputs, day_of_year=172),
-            params
-        )
+        # Winter solstice, spring equinox, summer solstice, fall equinox,
+        # at constant temperature to isolate the seasonal effect
+        doys = np.array([355, 80, 172, 266])
 
-        # Fall equinox (day ~266)
-        outputs_fall = hargreaves_et(
-            HargreavesETInputs(**base_inputs, day_of_year=266),
-            params
-        )
+        winter, spring, summer, fall = hargreaves_et_vec(15.0, 25.0, doys, 40.0)
 
         # Summer should have highest ET
-        assert outputs_summer.et0_mm > outputs_spring.et0_mm
-        assert outputs_summer.et0_mm > outputs_fall.et0_mm
-        assert outputs_summer.et0_mm > outputs_winter.et0_mm
+        assert summer > spring
+        assert summer > fall
+        assert summer > winter
 
         # Winter should have lowest ET
-        assert outputs_winter.et0_mm < outputs_spring.et0_mm
-        assert outputs_winter.et0_mm < outputs_fall.et0_mm
+        assert winter < spring
+        assert winter < fall
 
         # Equinoxes should be similar
-        assert abs(outputs_spring.et0_mm - outputs_fall.et0_mm) < 0.5
+        assert abs(spring - fall) < 0.5
 
     def test_et_seasonal_variation_equator(self):
         """Test seasonal variation in ET at equator (should be minimal)."""
@@ -266,21 +282,14 @@ class TestHargreavesETSeasonalEffects:
 
     def test_et_all_days_of_year(self):
         """Test that ET can be calculated for all days of year."""
-        params = HargreavesETParams(latitude_deg=45.0)
-
-        for day in [1, 50, 100, 150, 200, 250, 300, 350, 365]:
-            inputs = HargreavesETInputs(
-                tmin_c=10.0,
-                tmax_c=20.0,
-                day_of_year=day
-            )
+        days = np.arange(1, 367)
 
-            outputs = hargreaves_et(inputs, params)
+        et0 = hargreaves_et_vec(10.0, 20.0, days, 45.0)
 
-            # Should produce valid ET for all days
-            assert outputs.et0_mm >= 0.0
-            assert not math.isnan(outputs.et0_mm)
-            assert not math.isinf(outputs.et0_mm)
+        # Should produce valid ET for all days
+        assert et0.shape == days.shape
+        assert np.all(np.isfinite(et0))
+        assert np.all(et0 >= 0.0)
 
 
 class TestHargreavesETTemperatureRanges:
@@ -344,10 +353,13 @@ class TestExtraterrestrialRadiation:
 
     def test_ra_positive_all_latitudes(self):
         """Test that Ra is positive for all reasonable latitudes."""
-        for lat in [-60, -30, 0, 30, 60]:
-            for doy in [1, 90, 180, 270, 365]:
-                ra = _calculate_ra(doy, lat)
-                assert ra >= 0.0, f"Ra should be non-negative for lat={lat}, doy={doy}"
+        lats, doys = np.meshgrid([-60.0, -30.0, 0.0, 30.0, 60.0], [1, 90, 180, 270, 365])
+
+        ra = _calculate_ra_vec(doys, lats)
+
+        assert np.all(ra >= 0.0)
+        for i, j in np.ndindex(lats.shape):
+            assert _calculate_ra(int(doys[i, j]), lats[i, j]) == pytest.approx(ra[i, j], rel=1e-12)
 
     def test_ra_summer_vs_winter_midlatitude(self):
         """Test Ra is higher in summer than winter at mid-latitude."""
@@ -380,14 +392,69 @@ class TestExtraterrestrialRadiation:
         # During northern summer, northern hemisphere should have higher Ra
         assert ra_north > ra_south
 
+    def test_ra_fractional_day_matches_table_days(self):
+        """Test that non-tabulated days fall back to the direct formula."""
+        for lat in [-40.0, 0.0, 45.0]:
+            expected_100 = _calculate_ra(100, lat)
+            expected_200 = _calculate_ra(200, lat)
+            assert _calculate_ra(100.0, lat) == pytest.approx(expected_100, rel=1e-12)
+            assert _calculate_ra(np.int64(200), lat) == pytest.approx(expected_200, rel=1e-12)
+
+        # Ra rises through northern spring, so a half day sits between its neighbours
+        assert _calculate_ra(99, 45.0) < _calculate_ra(99.5, 45.0) < _calculate_ra(100, 45.0)
+
     def test_ra_reasonable_magnitude(self):
         """Test Ra has reasonable magnitude."""
         # Typical Ra values range from ~2-45 MJ/m²/day
         # (can be very low at high latitudes in winter)
-        for lat in [0, 30, 45, 60]:
-            for doy in [1, 90, 180, 270]:
-                ra = _calculate_ra(doy, lat)
-                assert 0.0 <= ra < 50.0, f"Ra out of reasonable range for lat={lat}, doy={doy}"
+        lats, doys = np.meshgrid([0.0, 30.0, 45.0, 60.0], [1, 90, 180, 270])
+
+        ra = _calculate_ra_vec(doys, lats)
+
+        assert np.all(ra >= 0.0)
+        np.testing.assert_array_less(ra, 50.0)
+        for i, j in np.ndindex(lats.shape):
+            assert _calculate_ra(int(doys[i, j]), lats[i, j]) == pytest.approx(ra[i, j], rel=1e-12)
+
+    def test_ra_polar_day_and_night(self):
+        """Test that scalar Ra handles the sun never setting or never rising."""
+        assert _calculate_ra(172, 80.0) > 0.0
+        assert _calculate_ra(355, 80.0) == 0.0
+
+
+class TestHargreavesETVectorized:
+    """Test the vectorized Hargreaves ET and Ra kernels."""
+
+    def test_vec_matches_scalar(self):
+        """Test that the vectorized kernel reproduces hargreaves_et pointwise."""
+        lats, doys = np.meshgrid([-45.0, -10.0, 0.0, 30.0, 60.0], [1, 80, 172, 266, 355, 366])
+        tmin = np.full(lats.shape, 8.0)
+        tmax = np.linspace(5.0, 30.0, lats.size).reshape(lats.shape)
+
+        et0 = hargreaves_et_vec(tmin, tmax, doys, lats, 0.0025)
+
+        for i, j in np.ndindex(lats.shape):
+            expected = hargreaves_et_scalar(
+                tmin[i, j], tmax[i, j], int(doys[i, j]), lats[i, j], 0.0025
+            )
+            assert et0[i, j] == pytest.approx(expected, rel=1e-12, abs=1e-12)
+
+    def test_vec_broadcasts_scalars(self):
+        """Test that scalar arguments broadcast against array arguments."""
+        days = np.array([1, 172])
+
+        et0 = hargreaves_et_vec(np.array([10.0, 10.0]), 25.0, days, 45.0)
+
+        assert et0.shape == (2,)
+        assert et0[1] > et0[0]
+
+    def test_ra_vec_polar_day_and_night(self):
+        """Test that Ra stays finite when the sun never sets or never rises."""
+        ra = _calculate_ra_vec(np.array([172, 355]), 80.0)
+
+        assert np.all(np.isfinite(ra))
+        assert ra[0] > 0.0
+        assert ra[1] == 0.0
 
 
 class TestHargreavesETCoefficientEffect:
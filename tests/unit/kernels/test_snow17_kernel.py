@@ -8,9 +8,14 @@ Tests the pure Snow17 algorithm implementation including:
 - State transitions
 """
 
+import sys
+from dataclasses import replace
+
+import numpy as np
 import pytest
 from waterlib.kernels.hydrology.snow17 import (
     snow17_step,
+    snow17_step_batch,
     Snow17Params,
     Snow17State,
     Snow17Inputs,
@@ -18,69 +23,99 @@ from waterlib.kernels.hydrology.snow17 import (
 )
 
 
-class TestSnow17BasicFunctionality:
-    """Test basic Snow17 kernel functionality."""
-
-    def test_snow_accumulation_cold_temperature(self):
-        """Test that snow accumulates when temperature is below freezing."""
-        params = Snow17Params(
-            mfmax=1.6,
-            mfmin=0.6,
-            pxtemp1=0.0,
-            pxtemp2=1.0,
-            scf=1.0
-        )
-        state = Snow17State(w_i=0.0, w_q=0.0, ait=0.0, deficit=0.0)
-        inputs = Snow17Inputs(
-            temp_c=-5.0,
-            precip_mm=10.0,
-            elevation_m=1500.0,
-            ref_elevation_m=1000.0,
-            day_of_year=15,
-            days_in_year=365,
-            dt_hours=24.0,
-            latitude=45.0
-        )
-
-        new_state, outputs = snow17_step(inputs, params, state)
-
-        # At -5°C, all precipitation should be snow
-        assert outputs.snow_mm > 0.0
-        assert outputs.rain_mm == 0.0
-        # Snow should accumulate (SWE increases)
-        assert new_state.w_i > state.w_i
-        assert outputs.swe_mm > 0.0
-        # No melt should occur at cold temperature
-        assert outputs.runoff_mm == 0.0
+# Shared timestep inputs: one day at the station elevation; tests replace
+# only the fields they exercise
+BASE_INPUTS = Snow17Inputs(
+    temp_c=0.0,
+    precip_mm=0.0,
+    elevation_m=1000.0,
+    ref_elevation_m=1000.0,
+    day_of_year=1,
+    days_in_year=365,
+    dt_hours=24.0,
+    latitude=45.0
+)
 
-    def test_melt_warm_temperature(self):
-        """Test that snow melts when temperature is above freezing."""
-        params = Snow17Params(
-            mfmax=1.6,
-            mfmin=0.6,
-            mbase=0.0,
-            pxtemp1=0.0,
-            pxtemp2=1.0
-        )
-        # Start with existing snowpack
-        state = Snow17State(w_i=50.0, w_q=0.0, ait=0.0, deficit=0.0)
-        inputs = Snow17Inputs(
-            temp_c=5.0,
-            precip_mm=0.0,
-            elevation_m=1500.0,
-            ref_elevation_m=1000.0,
-            day_of_year=150,  # Summer
-            days_in_year=365,
-            dt_hours=24.0,
-            latitude=45.0
-        )
 
-        new_state, outputs = snow17_step(inputs, params, state)
+class TestSnow17BasicFunctionality:
+    """Test basic Snow17 kernel functionality."""
 
-        # Snow should melt (ice content decreases)
-        assert new_state.w_i < state.w_i
-        # Some runoff should be generated
-        assert outputs.runoff_mm > 0.0
+    # (state, input overrides, named conditions on (state, new_state, outputs)),
+    # all with default parameters; each condition is asserted under its name
+    STATE_TRANSITIONS = [
+        pytest.param(
+            Snow17State(w_i=0.0, w_q=0.0, ait=0.0, deficit=0.0),
+            dict(temp_c=-5.0, precip_mm=10.0, elevation_m=1500.0, day_of_year=15),
+            # All snow, stored as ice with no melt
+            lambda old, new, out: {
+                "snow_mm > 0": out.snow_mm > 0.0,
+                "rain_mm == 0": out.rain_mm == 0.0,
+                "w_i increases": new.w_i > old.w_i,
+                "swe_mm > 0": out.swe_mm > 0.0,
+                "runoff_mm == 0": out.runoff_mm == 0.0,
+            },
+            id="snow_accumulation_cold_temperature"
+        ),
+        pytest.param(
+            Snow17State(w_i=50.0, w_q=0.0, ait=0.0, deficit=0.0),
+            dict(temp_c=5.0, elevation_m=1500.0, day_of_year=150),
+            # Ice melts and generates runoff
+            lambda old, new, out: {
+                "w_i decreases": new.w_i < old.w_i,
+                "runoff_mm > 0": out.runoff_mm > 0.0,
+            },
+            id="melt_warm_temperature"
+        ),
+        pytest.param(
+            Snow17State(w_i=30.0, w_q=0.0, ait=-2.0, deficit=5.0),
+            dict(temp_c=-3.0, precip_mm=5.0, day_of_year=50),
+            # New snow adds ice; deficit stays non-negative
+            lambda old, new, out: {
+                "w_i increases": new.w_i > old.w_i,
+                "deficit >= 0": new.deficit >= 0.0,
+            },
+            id="w_i"
+        ),
+        pytest.param(
+            Snow17State(w_i=50.0, w_q=0.0, ait=0.0, deficit=0.0),
+            dict(temp_c=2.0, day_of_year=120),
+            # Liquid water held up to the default plwhc capacity
+            lambda old, new, out: {
+                "w_q <= plwhc * w_i": new.w_q <= Snow17Params().plwhc * new.w_i,
+            },
+            id="w_q"
+        ),
+        pytest.param(
+            Snow17State(w_i=40.0, w_q=0.0, ait=-5.0, deficit=10.0),
+            dict(temp_c=-1.0, day_of_year=80),
+            # ATI warms toward air temperature but never exceeds 0
+            lambda old, new, out: {
+                "ait increases": new.ait > old.ait,
+                "ait <= 0": new.ait <= 0.0,
+            },
+            id="ait"
+        ),
+        pytest.param(
+            Snow17State(w_i=60.0, w_q=0.0, ait=-3.0, deficit=15.0),
+            dict(temp_c=-8.0, precip_mm=3.0, day_of_year=30),
+            # Deficit stays within [0, 0.33 * ice]
+            lambda old, new, out: {
+                "deficit >= 0": new.deficit >= 0.0,
+                "deficit <= 0.33 * w_i": new.deficit <= 0.33 * new.w_i,
+            },
+            id="deficit"
+        ),
+    ]
+
+    @pytest.mark.parametrize("state,input_overrides,conditions", STATE_TRANSITIONS)
+    def test_state_transitions(self, state, input_overrides, conditions):
+        """Test accumulation, melt and per-variable state transitions."""
+        inputs = replace(BASE_INPUTS, **input_overrides)
+
+        new_state, outputs = snow17_step(inputs, Snow17Params(), state)
+
+        for name, holds in conditions(state, new_state, outputs).items():
+            assert holds, name
 
     def test_rain_on_snow_event(self):
         """Test rain-on-snow event with enhanced melt."""
@@ -94,15 +129,12 @@ class TestSnow17BasicFunctionality:
         )
         # Start with existing snowpack
         state = Snow17State(w_i=100.0, w_q=0.0, ait=0.0, deficit=0.0)
-        inputs = Snow17Inputs(
+        inputs = replace(
+            BASE_INPUTS,
             temp_c=6.0,  # Warm enough to be rain after lapse rate adjustment
             precip_mm=20.0,  # Significant rain
             elevation_m=1500.0,
-            ref_elevation_m=1000.0,
-            day_of_year=100,
-            days_in_year=365,
-            dt_hours=24.0,
-            latitude=45.0
+            day_of_year=100
         )
 
         new_state, outputs = snow17_step(inputs, params, state)
@@ -115,101 +147,31 @@ class TestSnow17BasicFunctionality:
         # Runoff should be generated
         assert outputs.runoff_mm > 0.0
 
-    def test_state_transitions_w_i(self):
-        """Test ice content (w_i) state transitions."""
-        params = Snow17Params()
-        state = Snow17State(w_i=30.0, w_q=0.0, ait=-2.0, deficit=5.0)
-
-        # Cold day with snow
-        inputs = Snow17Inputs(
-            temp_c=-3.0,
-            precip_mm=5.0,
-            elevation_m=1000.0,
-            ref_elevation_m=1000.0,
-            day_of_year=50,
-            days_in_year=365,
-            dt_hours=24.0,
-            latitude=45.0
-        )
-
-        new_state, outputs = snow17_step(inputs, params, state)
-
-        # Ice should increase with new snow
-        assert new_state.w_i > state.w_i
-        # Deficit should be affected by new cold snow
-        assert new_state.deficit >= 0.0
-
-    def test_state_transitions_w_q(self):
-        """Test liquid water (w_q) state transitions."""
-        params = Snow17Params(plwhc=0.04)
-        # Ripe snowpack (no deficit)
-        state = Snow17State(w_i=50.0, w_q=0.0, ait=0.0, deficit=0.0)
-
-        # Warm day causing melt
-        inputs = Snow17Inputs(
-            temp_c=2.0,
-            precip_mm=0.0,
-            elevation_m=1000.0,
-            ref_elevation_m=1000.0,
-            day_of_year=120,
-            days_in_year=365,
-            dt_hours=24.0,
-            latitude=45.0
-        )
-
-        new_state, outputs = snow17_step(inputs, params, state)
-
-        # Liquid water should be held up to capacity
-        max_liquid_capacity = params.plwhc * new_state.w_i
-        assert new_state.w_q <= max_liquid_capacity
-
-    def test_state_transitions_ait(self):
-        """Test Antecedent Temperature Index (ait) state transitions."""
-        params = Snow17Params(tipm=0.15)
-        state = Snow17State(w_i=40.0, w_q=0.0, ait=-5.0, deficit=10.0)
 
-        # Warming trend
-        inputs = Snow17Inputs(
-            temp_c=-1.0,
-            precip_mm=0.0,
-            elevation_m=1000.0,
-            ref_elevation_m=1000.0,
-            day_of_year=80,
-            days_in_year=365,
-            dt_hours=24.0,
-            latitude=45.0
-        )
+class TestSnow17Types:
+    """Test the kernel dataclass layout."""
 
-        new_state, outputs = snow17_step(inputs, params, state)
+    def test_params_are_frozen(self):
+        """Test that parameters cannot be mutated after construction."""
+        params = Snow17Params()
 
-        # ATI should warm toward air temperature
-        assert new_state.ait > state.ait
-        # ATI should not exceed 0
-        assert new_state.ait <= 0.0
+        with pytest.raises(AttributeError):
+            params.mfmax = 2.0
 
-    def test_state_transitions_deficit(self):
-        """Test heat deficit state transitions."""
-        params = Snow17Params()
-        state = Snow17State(w_i=60.0, w_q=0.0, ait=-3.0, deficit=15.0)
-
-        # Cold day
-        inputs = Snow17Inputs(
-            temp_c=-8.0,
-            precip_mm=3.0,
-            elevation_m=1000.0,
-            ref_elevation_m=1000.0,
-            day_of_year=30,
-            days_in_year=365,
-            dt_hours=24.0,
-            latitude=45.0
+    @pytest.mark.skipif(sys.version_info < (3, 10), reason="dataclass slots need Python 3.10+")
+    def test_kernel_types_use_slots(self):
+        """Test that per-timestep kernel objects carry no instance __dict__."""
+        inputs = replace(
+            BASE_INPUTS,
+            temp_c=-5.0,
+            precip_mm=10.0,
+            day_of_year=15
         )
 
-        new_state, outputs = snow17_step(inputs, params, state)
+        new_state, outputs = snow17_step(inputs, Snow17Params(), Snow17State())
 
-        # Deficit should be non-negative
-        assert new_state.deficit >= 0.0
-        # Deficit should be bounded by ice content
-        assert new_state.deficit <= 0.33 * new_state.w_i
+        for obj in (inputs, new_state, outputs):
+            assert not hasattr(obj, '__dict__')
 
 
 class TestSnow17EdgeCases:
@@ -219,15 +181,11 @@ class TestSnow17EdgeCases:
         """Test behavior with no snowpack and rain."""
         params = Snow17Params()
         state = Snow17State(w_i=0.0, w_q=0.0, ait=0.0, deficit=0.0)
-        inputs = Snow17Inputs(
+        inputs = replace(
+            BASE_INPUTS,
             temp_c=10.0,
             precip_mm=15.0,
-            elevation_m=1000.0,
-            ref_elevation_m=1000.0,
-            day_of_year=180,
-            days_in_year=365,
-            dt_hours=24.0,
-            latitude=45.0
+            day_of_year=180
         )
 
         new_state, outputs = snow17_step(inputs, params, state)
@@ -245,15 +203,11 @@ class TestSnow17EdgeCases:
         """Test complete melting of snowpack."""
         params = Snow17Params(mfmax=3.0)  # High melt factor
         state = Snow17State(w_i=10.0, w_q=0.0, ait=0.0, deficit=0.0)
-        inputs = Snow17Inputs(
+        inputs = replace(
+            BASE_INPUTS,
             temp_c=15.0,  # Very warm
             precip_mm=0.0,
-            elevation_m=1000.0,
-            ref_elevation_m=1000.0,
-            day_of_year=150,
-            days_in_year=365,
-            dt_hours=24.0,
-            latitude=45.0
+            day_of_year=150
         )
 
         new_state, outputs = snow17_step(inputs, params, state)
@@ -267,15 +221,11 @@ class TestSnow17EdgeCases:
         """Test precipitation in transition temperature range."""
         params = Snow17Params(pxtemp1=0.0, pxtemp2=1.0)
         state = Snow17State(w_i=20.0, w_q=0.0, ait=0.0, deficit=0.0)
-        inputs = Snow17Inputs(
+        inputs = replace(
+            BASE_INPUTS,
             temp_c=0.5,  # Between pxtemp1 and pxtemp2
             precip_mm=10.0,
-            elevation_m=1000.0,
-            ref_elevation_m=1000.0,
-            day_of_year=90,
-            days_in_year=365,
-            dt_hours=24.0,
-            latitude=45.0
+            day_of_year=90
         )
 
         new_state, outputs = snow17_step(inputs, params, state)
@@ -301,15 +251,11 @@ class TestSnow17KnownInputOutput:
             pxtemp2=1.0
         )
         state = Snow17State(w_i=0.0, w_q=0.0, ait=0.0, deficit=0.0)
-        inputs = Snow17Inputs(
+        inputs = replace(
+            BASE_INPUTS,
             temp_c=-10.0,
             precip_mm=20.0,
-            elevation_m=1000.0,
-            ref_elevation_m=1000.0,
-            day_of_year=1,
-            days_in_year=365,
-            dt_hours=24.0,
-            latitude=45.0
+            day_of_year=1
         )
 
         new_state, outputs = snow17_step(inputs, params, state)
@@ -328,15 +274,11 @@ class TestSnow17KnownInputOutput:
         """Test known case: warm day with rain only."""
         params = Snow17Params(pxtemp1=0.0, pxtemp2=1.0)
         state = Snow17State(w_i=0.0, w_q=0.0, ait=0.0, deficit=0.0)
-        inputs = Snow17Inputs(
+        inputs = replace(
+            BASE_INPUTS,
             temp_c=10.0,
             precip_mm=25.0,
-            elevation_m=1000.0,
-            ref_elevation_m=1000.0,
-            day_of_year=180,
-            days_in_year=365,
-            dt_hours=24.0,
-            latitude=45.0
+            day_of_year=180
         )
 
         new_state, outputs = snow17_step(inputs, params, state)
@@ -360,15 +302,11 @@ class TestSnow17ParameterValidation:
         params_scf15 = Snow17Params(scf=1.5, pxtemp1=0.0, pxtemp2=1.0)
 
         state = Snow17State(w_i=0.0, w_q=0.0, ait=0.0, deficit=0.0)
-        inputs = Snow17Inputs(
+        inputs = replace(
+            BASE_INPUTS,
             temp_c=-5.0,
             precip_mm=10.0,
-            elevation_m=1000.0,
-            ref_elevation_m=1000.0,
-            day_of_year=50,
-            days_in_year=365,
-            dt_hours=24.0,
-            latitude=45.0
+            day_of_year=50
         )
 
         _, outputs1 = snow17_step(inputs, params_scf1, state)
@@ -384,26 +322,19 @@ class TestSnow17ParameterValidation:
         state = Snow17State(w_i=50.0, w_q=0.0, ait=0.0, deficit=0.0)
 
         # Same temperature at different elevations
-        inputs_low = Snow17Inputs(
+        inputs_low = replace(
+            BASE_INPUTS,
             temp_c=2.0,
             precip_mm=0.0,
-            elevation_m=1000.0,
-            ref_elevation_m=1000.0,
-            day_of_year=100,
-            days_in_year=365,
-            dt_hours=24.0,
-            latitude=45.0
+            day_of_year=100
         )
 
-        inputs_high = Snow17Inputs(
+        inputs_high = replace(
+            BASE_INPUTS,
             temp_c=2.0,
             precip_mm=0.0,
             elevation_m=2000.0,  # 1000m higher
-            ref_elevation_m=1000.0,
-            day_of_year=100,
-            days_in_year=365,
-            dt_hours=24.0,
-            latitude=45.0
+            day_of_year=100
         )
 
         _, outputs_low = snow17_step(inputs_low, params, state)
@@ -413,3 +344,84 @@ class TestSnow17ParameterValidation:
         # (or potentially more snow if precipitation was present)
         # At minimum, runoff should be different
         assert outputs_low.runoff_mm != outputs_high.runoff_mm
+
+
+class TestSnow17Batch:
+    """Test the vectorized snow17_step_batch kernel against snow17_step."""
+
+    STATE_FIELDS = ('w_i', 'w_q', 'ait', 'deficit')
+    OUTPUT_FIELDS = ('runoff_mm', 'swe_mm', 'rain_mm', 'snow_mm')
+
+    # (state, temp_c, precip_mm, elevation_m, day_of_year, latitude), chosen
+    # to reach every branch: bare ground, cold pack, ripening, super-ripe,
+    # rain-on-snow, mixed precipitation, ATI reset and the high-latitude
+    # melt factor ramps
+    CASES = [
+        (Snow17State(0.0, 0.0, 0.0, 0.0), -5.0, 10.0, 1500.0, 15, 45.0),
+        (Snow17State(50.0, 0.0, 0.0, 0.0), 5.0, 0.0, 1500.0, 150, 45.0),
+        (Snow17State(100.0, 0.0, 0.0, 0.0), 6.0, 20.0, 1500.0, 100, 45.0),
+        (Snow17State(30.0, 0.0, -2.0, 5.0), -3.0, 5.0, 1000.0, 50, 45.0),
+        (Snow17State(40.0, 0.0, -5.0, 10.0), -1.0, 0.0, 1000.0, 80, 45.0),
+        (Snow17State(60.0, 0.0, -3.0, 15.0), -8.0, 3.0, 1000.0, 30, 45.0),
+        (Snow17State(0.0, 0.0, 0.0, 0.0), 10.0, 15.0, 1000.0, 180, 45.0),
+        (Snow17State(20.0, 0.0, 0.0, 0.0), 0.5, 10.0, 1000.0, 90, 45.0),
+        (Snow17State(80.0, 1.0, -1.0, 8.0), 1.5, 2.0, 1000.0, 100, 60.0),
+        (Snow17State(80.0, 1.0, -1.0, 0.5), 3.0, 1.0, 1000.0, 250, 60.0),
+        (Snow17State(80.0, 0.0, -4.0, 20.0), 4.0, 0.0, 1000.0, 200, 70.0),
+        (Snow17State(5.0, 0.2, 0.0, 0.0), 12.0, 0.0, 1000.0, 10, 65.0),
+    ]
+
+    def _batch_of(self, cases):
+        """Stack per-case states and inputs into array-valued dataclasses."""
+        states = [case[0] for case in cases]
+        state = Snow17State(**{
+            name: np.array([getattr(s, name) for s in states])
+            for name in self.STATE_FIELDS
+        })
+        inputs = replace(
+            BASE_INPUTS,
+            temp_c=np.array([case[1] for case in cases]),
+            precip_mm=np.array([case[2] for case in cases]),
+            elevation_m=np.array([case[3] for case in cases]),
+            day_of_year=np.array([case[4] for case in cases]),
+            latitude=np.array([case[5] for case in cases])
+        )
+        return inputs, state
+
+    def test_batch_matches_scalar(self):
+        """Test that one batch call reproduces snow17_step for every case."""
+        params = Snow17Params()
+        inputs, state = self._batch_of(self.CASES)
+
+        batch_state, batch_outputs = snow17_step_batch(inputs, params, state)
+
+        for i, (case_state, temp, precip, elev, doy, lat) in enumerate(self.CASES):
+            expected_state, expected_outputs = snow17_step(
+                Snow17Inputs(temp, precip, elev, 1000.0, doy, 365, 24.0, lat),
+                params, case_state
+            )
+            for name in self.STATE_FIELDS:
+                assert getattr(batch_state, name)[i] == pytest.approx(
+                    getattr(expected_state, name), rel=1e-12, abs=1e-12
+                )
+            for name in self.OUTPUT_FIELDS:
+                assert getattr(batch_outputs, name)[i] == pytest.approx(
+                    getattr(expected_outputs, name), rel=1e-12, abs=1e-12
+                )
+
+    def test_batch_broadcasts_params(self):
+        """Test that array-valued params sweep one scalar input and state."""
+        params = Snow17Params(scf=np.array([1.0, 1.2, 1.5]), pxtemp1=0.0, pxtemp2=0.0)
+        state = Snow17State()
+        inputs = replace(
+            BASE_INPUTS,
+            temp_c=-5.0,
+            precip_mm=10.0,
+            day_of_year=50
+        )
+
+        new_state, outputs = snow17_step_batch(inputs, params, state)
+
+        np.testing.assert_allclose(outputs.snow_mm, [10.0, 12.0, 15.0])
+        np.testing.assert_allclose(new_state.w_i, outputs.swe_mm)
+        assert np.all(outputs.rain_mm == 0.0)
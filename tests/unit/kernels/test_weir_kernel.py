@@ -8,26 +8,35 @@ Tests the pure weir discharge calculation including:
 - Different weir coefficients and widths
 """
 
+import sys
+
+import numpy as np
 import pytest
 from waterlib.kernels.hydraulics.weir import (
     weir_discharge,
     spillway_discharge,
+    weir_discharge_vec,
+    spillway_discharge_vec,
     WeirParams,
     WeirInputs,
     WeirOutputs
 )
 
 
+# Params are frozen, so one standard weir is shared across tests
+STANDARD_PARAMS = WeirParams(
+    coefficient=1.8,
+    width_m=10.0,
+    crest_elevation_m=100.0
+)
+
+
 class TestWeirBasicFunctionality:
     """Test basic weir kernel functionality."""
 
     def test_weir_discharge_positive_head(self):
         """Test weir discharge with positive head."""
-        params = WeirParams(
-            coefficient=1.8,
-            width_m=10.0,
-            crest_elevation_m=100.0
-        )
+        params = STANDARD_PARAMS
         inputs = WeirInputs(water_elevation_m=101.0)
 
         outputs = weir_discharge(inputs, params)
@@ -42,11 +51,7 @@ class TestWeirBasicFunctionality:
 
     def test_weir_discharge_zero_head(self):
         """Test zero discharge when head = 0."""
-        params = WeirParams(
-            coefficient=1.8,
-            width_m=10.0,
-            crest_elevation_m=100.0
-        )
+        params = STANDARD_PARAMS
         inputs = WeirInputs(water_elevation_m=100.0)
 
         outputs = weir_discharge(inputs, params)
@@ -59,11 +64,7 @@ class TestWeirBasicFunctionality:
 
     def test_weir_discharge_negative_head(self):
         """Test zero discharge when water elevation below crest."""
-        params = WeirParams(
-            coefficient=1.8,
-            width_m=10.0,
-            crest_elevation_m=100.0
-        )
+        params = STANDARD_PARAMS
         inputs = WeirInputs(water_elevation_m=95.0)
 
         outputs = weir_discharge(inputs, params)
@@ -76,11 +77,7 @@ class TestWeirBasicFunctionality:
 
     def test_discharge_increases_with_head(self):
         """Test that discharge increases with head^1.5."""
-        params = WeirParams(
-            coefficient=1.8,
-            width_m=10.0,
-            crest_elevation_m=100.0
-        )
+        params = STANDARD_PARAMS
 
         # Test with increasing head values
         inputs_1m = WeirInputs(water_elevation_m=101.0)
@@ -150,16 +147,34 @@ class TestWeirBasicFunctionality:
         assert abs(ratio - expected_ratio) < 0.01
 
 
+class TestWeirTypes:
+    """Test the kernel dataclass layout."""
+
+    def test_params_are_frozen(self):
+        """Test that weir parameters cannot be mutated after construction."""
+        params = STANDARD_PARAMS
+
+        with pytest.raises(AttributeError):
+            params.width_m = 20.0
+
+    @pytest.mark.skipif(sys.version_info < (3, 10), reason="dataclass slots need Python 3.10+")
+    def test_kernel_types_use_slots(self):
+        """Test that per-call kernel objects carry no instance __dict__."""
+        params = STANDARD_PARAMS
+        inputs = WeirInputs(water_elevation_m=101.0)
+
+        outputs = weir_discharge(inputs, params)
+
+        for obj in (params, inputs, outputs):
+            assert not hasattr(obj, '__dict__')
+
+
 class TestWeirKnownValues:
     """Test with known input/output pairs for validation."""
 
     def test_known_case_1(self):
         """Test known case: C=1.8, L=10m, H=1m."""
-        params = WeirParams(
-            coefficient=1.8,
-            width_m=10.0,
-            crest_elevation_m=100.0
-        )
+        params = STANDARD_PARAMS
         inputs = WeirInputs(water_elevation_m=101.0)
 
         outputs = weir_discharge(inputs, params)
@@ -209,11 +224,7 @@ class TestWeirEdgeCases:
 
     def test_very_small_head(self):
         """Test with very small head value."""
-        params = WeirParams(
-            coefficient=1.8,
-            width_m=10.0,
-            crest_elevation_m=100.0
-        )
+        params = STANDARD_PARAMS
         inputs = WeirInputs(water_elevation_m=100.001)
 
         outputs = weir_discharge(inputs, params)
@@ -225,11 +236,7 @@ class TestWeirEdgeCases:
 
     def test_very_large_head(self):
         """Test with very large head value."""
-        params = WeirParams(
-            coefficient=1.8,
-            width_m=10.0,
-            crest_elevation_m=100.0
-        )
+        params = STANDARD_PARAMS
         inputs = WeirInputs(water_elevation_m=110.0)
 
         outputs = weir_discharge(inputs, params)
@@ -326,11 +333,7 @@ class TestWeirUnitConversion:
 
     def test_m3s_to_m3d_conversion(self):
         """Test conversion from m³/s to m³/d."""
-        params = WeirParams(
-            coefficient=1.8,
-            width_m=10.0,
-            crest_elevation_m=100.0
-        )
+        params = STANDARD_PARAMS
         inputs = WeirInputs(water_elevation_m=101.5)
 
         outputs = weir_discharge(inputs, params)
@@ -341,11 +344,7 @@ class TestWeirUnitConversion:
 
     def test_conversion_consistency(self):
         """Test that conversion is consistent across different values."""
-        params = WeirParams(
-            coefficient=1.8,
-            width_m=10.0,
-            crest_elevation_m=100.0
-        )
+        params = STANDARD_PARAMS
 
         test_elevations = [100.5, 101.0, 102.0, 103.5]
 
@@ -356,3 +355,55 @@ class TestWeirUnitConversion:
             # Check conversion
             expected_m3d = outputs.discharge_m3s * 86400.0
             assert abs(outputs.discharge_m3d - expected_m3d) < 0.01
+
+
+class TestWeirVectorized:
+    """Test the vectorized weir and spillway kernels."""
+
+    def test_vec_matches_scalar(self):
+        """Test that weir_discharge_vec reproduces weir_discharge pointwise."""
+        params = STANDARD_PARAMS
+        elevations = np.array([95.0, 100.0, 100.001, 100.5, 101.0, 103.5, 110.0])
+
+        outputs = weir_discharge_vec(elevations, params)
+
+        for i, elevation in enumerate(elevations):
+            expected = weir_discharge(WeirInputs(water_elevation_m=elevation), params)
+            assert outputs.head_m[i] == expected.head_m
+            assert outputs.discharge_m3s[i] == expected.discharge_m3s
+            assert outputs.discharge_m3d[i] == expected.discharge_m3d
+
+    def test_vec_broadcasts_params(self):
+        """Test that array-valued params sweep one water elevation."""
+        params = WeirParams(
+            coefficient=np.array([1.5, 2.0]),
+            width_m=10.0,
+            crest_elevation_m=100.0
+        )
+
+        outputs = weir_discharge_vec(101.0, params)
+
+        np.testing.assert_allclose(outputs.discharge_m3s, [15.0, 20.0])
+
+    def test_vec_conversion_consistency(self):
+        """Test that the vectorized m³/s to m³/d conversion is consistent."""
+        elevations = np.array([100.5, 101.0, 102.0, 103.5])
+
+        outputs = weir_discharge_vec(elevations, STANDARD_PARAMS)
+
+        np.testing.assert_allclose(outputs.discharge_m3d, outputs.discharge_m3s * 86400.0)
+
+    def test_spillway_discharge_vec_same_as_weir(self):
+        """Test that spillway_discharge_vec gives same results as weir_discharge_vec."""
+        params = WeirParams(
+            coefficient=1.7,
+            width_m=20.0,
+            crest_elevation_m=245.0
+        )
+        elevations = np.array([244.0, 245.0, 246.5])
+
+        weir_outputs = weir_discharge_vec(elevations, params)
+        spillway_outputs = spillway_discharge_vec(elevations, params)
+
+        np.testing.assert_array_equal(spillway_outputs.discharge_m3s, weir_outputs.discharge_m3s)
+        np.testing.assert_array_equal(spillway_outputs.head_m, weir_outputs.head_m)
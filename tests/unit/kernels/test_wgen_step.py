@@ -1,5 +1,6 @@
 """Unit tests for wgen_step function."""
 import datetime
+import numpy as np
 import pytest
 from waterlib.kernels.climate.wgen import (
     wgen_step,
@@ -251,3 +252,45 @@ def test_wgen_step_non_negative_outputs():
         state, outputs = wgen_step(params, state)
         assert outputs.precip_mm >= 0.0
         assert outputs.solar_mjm2 >= 0.0
+
+
+def test_wgen_step_accepts_numpy_scalar_latitude():
+    """Test that NumPy scalar latitudes, e.g. taken from an array, behave like floats."""
+    param_kwargs = dict(
+        pww=[0.5] * 12,
+        pwd=[0.3] * 12,
+        alpha=[1.0] * 12,
+        beta=[10.0] * 12,
+        txmd=20.0,
+        atx=10.0,
+        txmw=18.0,
+        tn=10.0,
+        atn=8.0,
+        cvtx=0.1,
+        acvtx=0.05,
+        cvtn=0.1,
+        acvtn=0.05,
+        rmd=15.0,
+        ar=5.0,
+        rmw=12.0,
+        random_seed=42
+    )
+
+    # Both hemispheres, in the float widths NumPy arrays commonly hold
+    for latitude in np.array([40.0, -30.0]):
+        for numpy_latitude in (latitude, np.float32(latitude)):
+            state = WGENState(
+                is_wet=False,
+                random_state=None,
+                current_date=datetime.date(2024, 1, 15)
+            )
+
+            numpy_params = WGENParams(latitude=numpy_latitude, **param_kwargs)
+            float_params = WGENParams(latitude=float(latitude), **param_kwargs)
+
+            _, numpy_outputs = wgen_step(numpy_params, state)
+            _, float_outputs = wgen_step(float_params, state)
+
+            assert numpy_outputs.tmax_c == pytest.approx(float_outputs.tmax_c)
+            assert numpy_outputs.tmin_c == pytest.approx(float_outputs.tmin_c)
+            assert numpy_outputs.solar_mjm2 == pytest.approx(float_outputs.solar_mjm2)
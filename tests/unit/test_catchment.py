@@ -77,7 +77,7 @@ class TestCatchmentInitialization:
         assert catchment.snow17_params.mfmax == 1.2
         assert catchment.snow17_params.scf == 1.1
         assert catchment.awbm_params is not None
-        assert catchment.awbm_params.c_vec == [7.5, 76.0, 152.0]
+        assert catchment.awbm_params.c_vec == (7.5, 76.0, 152.0)
         assert catchment.awbm_params.bfi == 0.35
 
     def test_catchment_init_without_snow(self):
@@ -27,7 +27,7 @@ import pandas as pd
 import numpy as np
 
 from waterlib.core.exceptions import ConfigurationError
-from waterlib.kernels.climate.et import hargreaves_et, HargreavesETParams, HargreavesETInputs
+from waterlib.kernels.climate.et import hargreaves_et_scalar
 
 
 logger = logging.getLogger(__name__)
@@ -206,16 +206,23 @@ def load_wgen_parameters(param_file: Path, yaml_dir: Path) -> Dict[int, MonthlyP
             f"WGEN parameter file must have exactly 12 rows (one per month), found {len(df)}"
         )
 
-    # Parse parameters
+    # Parse parameters column-wise (avoids boxing each row into a Series)
     params = {}
-    for _, row in df.iterrows():
+    columns = zip(
+        df['month'].to_numpy(),
+        df['pww'].to_numpy(),
+        df['pwd'].to_numpy(),
+        df['alpha'].to_numpy(),
+        df['beta'].to_numpy()
+    )
+    for month, pww, pwd, alpha, beta in columns:
         try:
             month_params = MonthlyParams(
-                month=int(row['month']),
-                p_wet_wet=float(row['pww']),
-                p_wet_dry=float(row['pwd']),
-                alpha=float(row['alpha']),
-                beta=float(row['beta'])
+                month=int(month),
+                p_wet_wet=float(pww),
+                p_wet_dry=float(pwd),
+                alpha=float(alpha),
+                beta=float(beta)
             )
             params[month_params.month] = month_params
         except ValueError as e:
@@ -1006,22 +1013,8 @@ def calculate_hargreaves_et(tmin: float,
         ... )
         >>> print(f"ET0: {et0:.2f} mm/day")
     """
-    # Create kernel parameter and input objects
-    params = HargreavesETParams(
-        latitude_deg=latitude_deg,
-        coefficient=coefficient
-    )
-
-    inputs = HargreavesETInputs(
-        tmin_c=tmin,
-        tmax_c=tmax,
-        day_of_year=day_of_year
-    )
-
-    # Call the kernel
-    outputs = hargreaves_et(inputs, params)
-
-    return outputs.et0_mm
+    # Call the positional kernel directly; no dataclasses needed per call
+    return hargreaves_et_scalar(tmin, tmax, day_of_year, latitude_deg, coefficient)
 
 
 class ClimateManager:
@@ -15,7 +15,7 @@ from waterlib.kernels.hydrology.snow17 import (
     snow17_step, Snow17Params, Snow17State, Snow17Inputs, Snow17Outputs
 )
 from waterlib.kernels.hydrology.awbm import (
-    awbm_step, AWBMParams, AWBMState, AWBMInputs, AWBMOutputs
+    awbm_step_into, AWBMParams, AWBMState, AWBMInputs, AWBMOutputs
 )
 
 
@@ -248,6 +248,11 @@ class Catchment(Component):
                 b_base=initial_stores.get('b_base', 0.0)
             )
 
+        # AWBM outputs are written into this buffer each step rather than reallocated
+        self.awbm_outputs = AWBMOutputs(
+            runoff_mm=0.0, excess_mm=0.0, baseflow_mm=0.0, surface_flow_mm=0.0
+        )
+
         # Initialize outputs
         self.outputs['runoff'] = 0.0
         self.outputs['runoff_mm'] = 0.0
@@ -325,13 +330,14 @@ class Catchment(Component):
             pet_mm=pet
         )
 
-        # Call AWBM kernel
-        self.awbm_state, awbm_outputs = awbm_step(
-            awbm_inputs, self.awbm_params, self.awbm_state
+        # Call AWBM kernel, advancing the state in place
+        awbm_step_into(
+            awbm_inputs, self.awbm_params, self.awbm_state,
+            self.awbm_state, self.awbm_outputs
         )
 
         # Convert runoff from mm to m³/day
-        runoff_mm = awbm_outputs.runoff_mm
+        runoff_mm = self.awbm_outputs.runoff_mm
         runoff_m3d = runoff_mm * self.area * 1000.0  # area is in km², convert to m²
 
         # Update outputs
@@ -0,0 +1,9 @@
+"""
+Compatibility helpers shared by the kernel modules.
+"""
+
+import sys
+
+# dataclass(slots=True) needs Python 3.10+; older interpreters fall back to
+# regular dict-backed dataclasses with identical behaviour.
+DATACLASS_SLOTS = {'slots': True} if sys.version_info >= (3, 10) else {}
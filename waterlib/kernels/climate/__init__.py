@@ -15,6 +15,8 @@ All kernels follow the pure function pattern:
 
 from waterlib.kernels.climate.et import (
     hargreaves_et,
+    hargreaves_et_scalar,
+    hargreaves_et_vec,
     HargreavesETParams,
     HargreavesETInputs,
     ETOutputs
@@ -30,6 +32,8 @@ from waterlib.kernels.climate.wgen import (
 
 __all__ = [
     'hargreaves_et',
+    'hargreaves_et_scalar',
+    'hargreaves_et_vec',
     'HargreavesETParams',
     'HargreavesETInputs',
     'ETOutputs',
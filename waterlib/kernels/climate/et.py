@@ -12,12 +12,26 @@ Future methods can be added:
 All kernels are pure functions with no dependencies on the graph structure.
 """
 
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from typing import Tuple
 import math
 
+import numpy as np
 
-@dataclass
+from waterlib.kernels._compat import DATACLASS_SLOTS
+
+
+# Inverse relative Earth-Sun distance and solar declination (radians) depend
+# only on the integer day of year, so tabulate them once, indexed by day 0-366
+_DR_TABLE = tuple(
+    1 + 0.033 * math.cos(2 * math.pi * j / 365) for j in range(367)
+)
+_DELTA_TABLE = tuple(
+    0.409 * math.sin(2 * math.pi * j / 365 - 1.39) for j in range(367)
+)
+
+
+@dataclass(frozen=True, **DATACLASS_SLOTS)
 class HargreavesETParams:
     """
     Fixed parameters for Hargreaves-Samani ET calculation.
@@ -25,12 +39,25 @@ class HargreavesETParams:
     Attributes:
         latitude_deg: Site latitude in degrees (required for solar radiation)
         coefficient: Hargreaves coefficient (typically 0.0023)
+
+    Derived attributes (computed once on construction):
+        sin_lat, cos_lat, tan_lat: Trig functions of the latitude in radians
     """
     latitude_deg: float
     coefficient: float = 0.0023
+    sin_lat: float = field(init=False, repr=False)
+    cos_lat: float = field(init=False, repr=False)
+    tan_lat: float = field(init=False, repr=False)
+
+    def __post_init__(self):
+        # Frozen, so the derived values are written through object.__setattr__
+        latitude_rad = math.radians(self.latitude_deg)
+        object.__setattr__(self, 'sin_lat', math.sin(latitude_rad))
+        object.__setattr__(self, 'cos_lat', math.cos(latitude_rad))
+        object.__setattr__(self, 'tan_lat', math.tan(latitude_rad))
 
 
-@dataclass
+@dataclass(frozen=True, **DATACLASS_SLOTS)
 class HargreavesETInputs:
     """
     Inputs for one Hargreaves-Samani ET calculation.
@@ -45,7 +72,7 @@ class HargreavesETInputs:
     day_of_year: int
 
 
-@dataclass
+@dataclass(frozen=True, **DATACLASS_SLOTS)
 class ETOutputs:
     """
     Outputs from ET calculation.
@@ -87,24 +114,104 @@ def hargreaves_et(
         Hargreaves, G.H. and Samani, Z.A. (1985). Reference crop evapotranspiration
         from temperature. Applied Engineering in Agriculture, 1(2), 96-99.
     """
+    # Latitude trig is cached on params, so only the day-dependent terms remain
+    ra = _calculate_ra_with_trig(
+        inputs.day_of_year, params.sin_lat, params.cos_lat, params.tan_lat
+    )
+    et0_mm = _hargreaves_from_ra(inputs.tmin_c, inputs.tmax_c, ra, params.coefficient)
+
+    return ETOutputs(et0_mm=et0_mm)
+
+
+def hargreaves_et_scalar(
+    tmin_c: float,
+    tmax_c: float,
+    day_of_year: int,
+    latitude_deg: float,
+    coefficient: float = 0.0023
+) -> float:
+    """
+    Calculate Hargreaves-Samani reference ET from plain floats.
+
+    Positional form of hargreaves_et for callers that already hold the raw
+    values, so the hot path builds no input, parameter or output objects.
+
+    Args:
+        tmin_c: Minimum daily temperature (deg C)
+        tmax_c: Maximum daily temperature (deg C)
+        day_of_year: Day of year (1-366)
+        latitude_deg: Site latitude in degrees
+        coefficient: Hargreaves coefficient (typically 0.0023)
+
+    Returns:
+        Reference evapotranspiration (mm/day)
+    """
+    ra = _calculate_ra(day_of_year, latitude_deg)
+
+    return _hargreaves_from_ra(tmin_c, tmax_c, ra, coefficient)
+
+
+def _hargreaves_from_ra(
+    tmin_c: float,
+    tmax_c: float,
+    ra: float,
+    coefficient: float
+) -> float:
+    """
+    Apply the Hargreaves-Samani temperature terms to a known R_a (MJ/m²/day).
+
+    Returns:
+        Reference evapotranspiration (mm/day)
+    """
     # Calculate mean temperature
-    tmean = (inputs.tmin_c + inputs.tmax_c) / 2.0
+    tmean = (tmin_c + tmax_c) / 2.0
 
     # Calculate temperature range, clamping to zero if tmin > tmax
-    trange = max(0.0, inputs.tmax_c - inputs.tmin_c)
-
-    # Calculate extraterrestrial radiation
-    ra = _calculate_ra(inputs.day_of_year, params.latitude_deg)
+    trange = max(0.0, tmax_c - tmin_c)
 
     # Calculate ET0 using Hargreaves-Samani equation
     # ET0 = C_H * R_a * (T_mean + 17.8) * sqrt(T_range)
     # Result is in mm/day (R_a in MJ/m²/day, coefficient dimensionless)
-    et0_mm = params.coefficient * ra * (tmean + 17.8) * math.sqrt(trange)
+    et0_mm = coefficient * ra * (tmean + 17.8) * math.sqrt(trange)
 
     # Ensure non-negative result
-    et0_mm = max(0.0, et0_mm)
+    return max(0.0, et0_mm)
 
-    return ETOutputs(et0_mm=et0_mm)
+
+def hargreaves_et_vec(
+    tmin_c: np.ndarray,
+    tmax_c: np.ndarray,
+    day_of_year: np.ndarray,
+    latitude_deg: np.ndarray,
+    coefficient: float = 0.0023
+) -> np.ndarray:
+    """
+    Calculate Hargreaves-Samani reference ET for many days or sites at once.
+
+    Vectorized counterpart of hargreaves_et. All arguments may be NumPy arrays
+    or scalars and are broadcast against each other, so a whole year of daily
+    temperatures or a latitude x day grid is evaluated in one pass.
+
+    Args:
+        tmin_c: Minimum daily temperature (deg C)
+        tmax_c: Maximum daily temperature (deg C)
+        day_of_year: Day of year (1-366)
+        latitude_deg: Site latitude in degrees
+        coefficient: Hargreaves coefficient (typically 0.0023)
+
+    Returns:
+        Array of reference evapotranspiration (mm/day)
+    """
+    tmin = np.asarray(tmin_c, dtype=np.float64)
+    tmax = np.asarray(tmax_c, dtype=np.float64)
+
+    tmean = (tmin + tmax) / 2.0
+    trange = np.maximum(tmax - tmin, 0.0)
+    ra = _calculate_ra_vec(day_of_year, latitude_deg)
+
+    et0_mm = coefficient * ra * (tmean + 17.8) * np.sqrt(trange)
+
+    return np.maximum(et0_mm, 0.0)
 
 
 def _calculate_ra(day_of_year: int, latitude_deg: float) -> float:
@@ -129,22 +236,90 @@ def _calculate_ra(day_of_year: int, latitude_deg: float) -> float:
     # Convert latitude to radians
     latitude_rad = math.radians(latitude_deg)
 
+    return _calculate_ra_with_trig(
+        day_of_year,
+        math.sin(latitude_rad), math.cos(latitude_rad), math.tan(latitude_rad)
+    )
+
+
+def _calculate_ra_with_trig(
+    day_of_year: int,
+    sin_lat: float,
+    cos_lat: float,
+    tan_lat: float
+) -> float:
+    """
+    Calculate R_a from precomputed sine, cosine and tangent of the latitude.
+
+    Lets callers that evaluate many days at one site, such as hargreaves_et
+    with a reused HargreavesETParams, skip the latitude trig on every call.
+
+    Returns:
+        Extraterrestrial radiation in MJ/m²/day
+    """
     # Solar constant
     Gsc = 0.0820  # MJ/m²/min
 
-    # Inverse relative distance Earth-Sun
-    dr = 1 + 0.033 * math.cos(2 * math.pi * day_of_year / 365)
+    # Inverse relative distance Earth-Sun and solar declination (radians),
+    # looked up for integer days and computed directly otherwise
+    if isinstance(day_of_year, int) and 0 <= day_of_year <= 366:
+        dr = _DR_TABLE[day_of_year]
+        delta = _DELTA_TABLE[day_of_year]
+    else:
+        dr = 1 + 0.033 * math.cos(2 * math.pi * day_of_year / 365)
+        delta = 0.409 * math.sin(2 * math.pi * day_of_year / 365 - 1.39)
+
+    # Sunset hour angle (radians); clamp the argument so polar night (sun
+    # never rises, ws = 0) and polar day (sun never sets, ws = pi) stay in
+    # the acos domain
+    cos_ws = -tan_lat * math.tan(delta)
+    if cos_ws > 1.0:
+        cos_ws = 1.0
+    elif cos_ws < -1.0:
+        cos_ws = -1.0
+    ws = math.acos(cos_ws)
+
+    # Extraterrestrial radiation (MJ/m²/day)
+    ra = (24 * 60 / math.pi) * Gsc * dr * (
+        ws * sin_lat * math.sin(delta) +
+        cos_lat * math.cos(delta) * math.sin(ws)
+    )
+
+    return max(0.0, ra)  # Ensure non-negative
+
+
+def _calculate_ra_vec(day_of_year: np.ndarray, latitude_deg: np.ndarray) -> np.ndarray:
+    """
+    Calculate extraterrestrial radiation (R_a) for arrays of days and latitudes.
+
+    Vectorized counterpart of _calculate_ra; arguments are broadcast against
+    each other. The sunset hour angle argument is clipped to [-1, 1] so polar
+    day and polar night give finite values instead of NaN.
+
+    Args:
+        day_of_year: Day of year (1-366)
+        latitude_deg: Site latitude in degrees
+
+    Returns:
+        Array of extraterrestrial radiation in MJ/m²/day
+    """
+    latitude_rad = np.radians(np.asarray(latitude_deg, dtype=np.float64))
+    angle = 2 * np.pi * np.asarray(day_of_year, dtype=np.float64) / 365
+
+    # Solar constant
+    Gsc = 0.0820  # MJ/m²/min
 
-    # Solar declination (radians)
-    delta = 0.409 * math.sin(2 * math.pi * day_of_year / 365 - 1.39)
+    # Inverse relative distance Earth-Sun and solar declination (radians)
+    dr = 1 + 0.033 * np.cos(angle)
+    delta = 0.409 * np.sin(angle - 1.39)
 
     # Sunset hour angle (radians)
-    ws = math.acos(-math.tan(latitude_rad) * math.tan(delta))
+    ws = np.arccos(np.clip(-np.tan(latitude_rad) * np.tan(delta), -1.0, 1.0))
 
     # Extraterrestrial radiation (MJ/m²/day)
-    ra = (24 * 60 / math.pi) * Gsc * dr * (
-        ws * math.sin(latitude_rad) * math.sin(delta) +
-        math.cos(latitude_rad) * math.cos(delta) * math.sin(ws)
+    ra = (24 * 60 / np.pi) * Gsc * dr * (
+        ws * np.sin(latitude_rad) * np.sin(delta) +
+        np.cos(latitude_rad) * np.cos(delta) * np.sin(ws)
     )
 
-    return max(0.0, ra)  # Ensure non-negative
+    return np.maximum(ra, 0.0)
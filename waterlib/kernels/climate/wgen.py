@@ -1,9 +1,14 @@
 import datetime
+import math
 import numpy as np
 from dataclasses import dataclass
 from typing import List, Optional, Tuple
 
 
+# Fourier seasonal curves: one full cycle per 365 days
+_TWO_PI = 2.0 * math.pi
+
+
 @dataclass
 class WGENParams:
     pww: List[float]
@@ -126,8 +131,8 @@ def _calculate_seasonal_temp(
     # Fourier function: T = mean + amplitude * cos(2π(doy - peak)/365)
     # Peak day varies with latitude (Northern Hemisphere ~200, Southern ~20)
     peak_day = 200 if latitude >= 0 else 20
-    angle = 2 * np.pi * (day_of_year - peak_day) / 365
-    return mean + amplitude * np.cos(angle)
+    angle = _TWO_PI * (day_of_year - peak_day) / 365
+    return mean + amplitude * math.cos(angle)
 
 
 def _calculate_seasonal_radiation(
@@ -150,8 +155,8 @@ def _calculate_seasonal_radiation(
     """
     # Similar Fourier function for radiation
     peak_day = 172 if latitude >= 0 else 355  # Summer solstice
-    angle = 2 * np.pi * (day_of_year - peak_day) / 365
-    return max(0, mean + amplitude * np.cos(angle))
+    angle = _TWO_PI * (day_of_year - peak_day) / 365
+    return max(0, mean + amplitude * math.cos(angle))
 
 
 def wgen_step(params: WGENParams, state: WGENState) -> Tuple[WGENState, WGENOutputs]:
@@ -16,6 +16,8 @@ All kernels follow the pure function pattern:
 from waterlib.kernels.hydraulics.weir import (
     weir_discharge,
     spillway_discharge,
+    weir_discharge_vec,
+    spillway_discharge_vec,
     WeirParams,
     WeirInputs,
     WeirOutputs
@@ -24,6 +26,8 @@ from waterlib.kernels.hydraulics.weir import (
 __all__ = [
     'weir_discharge',
     'spillway_discharge',
+    'weir_discharge_vec',
+    'spillway_discharge_vec',
     'WeirParams',
     'WeirInputs',
     'WeirOutputs'
@@ -15,9 +15,14 @@ Where:
 
 from dataclasses import dataclass
 from typing import Tuple
+import math
 
+import numpy as np
 
-@dataclass
+from waterlib.kernels._compat import DATACLASS_SLOTS
+
+
+@dataclass(frozen=True, **DATACLASS_SLOTS)
 class WeirParams:
     """Fixed parameters for weir discharge calculation.
 
@@ -31,7 +36,7 @@ class WeirParams:
     crest_elevation_m: float
 
 
-@dataclass
+@dataclass(**DATACLASS_SLOTS)
 class WeirInputs:
     """Inputs for weir discharge calculation.
 
@@ -41,7 +46,7 @@ class WeirInputs:
     water_elevation_m: float
 
 
-@dataclass
+@dataclass(**DATACLASS_SLOTS)
 class WeirOutputs:
     """Outputs from weir discharge calculation.
 
@@ -90,8 +95,8 @@ def weir_discharge(inputs: WeirInputs, params: WeirParams) -> WeirOutputs:
     head_m = max(0.0, inputs.water_elevation_m - params.crest_elevation_m)
 
     if head_m > 0:
-        # Apply weir equation: Q = C × L × H^1.5
-        discharge_m3s = params.coefficient * params.width_m * (head_m ** 1.5)
+        # Apply weir equation: Q = C × L × H^1.5, with H^1.5 as H × sqrt(H)
+        discharge_m3s = params.coefficient * params.width_m * (head_m * math.sqrt(head_m))
 
         # Convert to m³/day
         discharge_m3d = discharge_m3s * 86400.0
@@ -130,3 +135,57 @@ def spillway_discharge(inputs: WeirInputs, params: WeirParams) -> WeirOutputs:
         True
     """
     return weir_discharge(inputs, params)
+
+
+def weir_discharge_vec(water_elevation_m: np.ndarray, params: WeirParams) -> WeirOutputs:
+    """
+    Calculate weir discharge for an array of water elevations at once.
+
+    Vectorized counterpart of weir_discharge for elevation series and rating
+    curves. The fields of params may also be arrays and broadcast against
+    water_elevation_m. Element for element, the results match weir_discharge.
+
+    Args:
+        water_elevation_m: Water surface elevations in meters
+        params: WeirParams containing weir characteristics
+
+    Returns:
+        WeirOutputs whose fields are arrays of discharge (m³/s, m³/d) and head
+
+    Example:
+        >>> params = WeirParams(coefficient=1.8, width_m=10.0, crest_elevation_m=100.0)
+        >>> outputs = weir_discharge_vec(np.array([99.0, 101.0]), params)
+        >>> outputs.head_m.tolist()
+        [0.0, 1.0]
+        >>> outputs.discharge_m3s.tolist()
+        [0.0, 18.0]
+    """
+    # Head over crest, clamped at zero so no flow below the crest
+    water_elevation_m = np.asarray(water_elevation_m, dtype=np.float64)
+    head_m = np.maximum(water_elevation_m - params.crest_elevation_m, 0.0)
+
+    # Apply weir equation: Q = C × L × H^1.5, with H^1.5 as H × sqrt(H)
+    discharge_m3s = params.coefficient * params.width_m * (head_m * np.sqrt(head_m))
+
+    return WeirOutputs(
+        discharge_m3s=discharge_m3s,
+        discharge_m3d=discharge_m3s * 86400.0,
+        head_m=head_m
+    )
+
+
+def spillway_discharge_vec(water_elevation_m: np.ndarray, params: WeirParams) -> WeirOutputs:
+    """
+    Calculate spillway discharge for an array of water elevations at once.
+
+    Vectorized counterpart of spillway_discharge; an alias for
+    weir_discharge_vec().
+
+    Args:
+        water_elevation_m: Water surface elevations in meters
+        params: WeirParams containing spillway characteristics
+
+    Returns:
+        WeirOutputs whose fields are arrays of discharge (m³/s, m³/d) and head
+    """
+    return weir_discharge_vec(water_elevation_m, params)
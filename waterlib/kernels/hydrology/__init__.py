@@ -15,6 +15,7 @@ All kernels follow the pure function pattern:
 
 from waterlib.kernels.hydrology.snow17 import (
     snow17_step,
+    snow17_step_batch,
     Snow17Params,
     Snow17State,
     Snow17Inputs,
@@ -23,6 +24,11 @@ from waterlib.kernels.hydrology.snow17 import (
 
 from waterlib.kernels.hydrology.awbm import (
     awbm_step,
+    awbm_step_into,
+    awbm_step_batch,
+    awbm_run_series,
+    awbm_run_ensemble,
+    awbm_iter_ensemble,
     AWBMParams,
     AWBMState,
     AWBMInputs,
@@ -31,11 +37,17 @@ from waterlib.kernels.hydrology.awbm import (
 
 __all__ = [
     'snow17_step',
+    'snow17_step_batch',
     'Snow17Params',
     'Snow17State',
     'Snow17Inputs',
     'Snow17Outputs',
     'awbm_step',
+    'awbm_step_into',
+    'awbm_step_batch',
+    'awbm_run_series',
+    'awbm_run_ensemble',
+    'awbm_iter_ensemble',
     'AWBMParams',
     'AWBMState',
     'AWBMInputs',
@@ -14,33 +14,56 @@ References:
     Environmental Modelling & Software, 19(10), 943-956.
 """
 
-from dataclasses import dataclass
-from typing import Tuple, List
+from dataclasses import dataclass, field
+from typing import Iterator, Sequence, Tuple
 
+import numpy as np
 
-@dataclass
+from waterlib.kernels._compat import DATACLASS_SLOTS
+
+
+@dataclass(frozen=True, **DATACLASS_SLOTS)
 class AWBMParams:
     """
     Fixed parameters for AWBM algorithm.
 
     Attributes:
-        c_vec: List of three capacity values [C1, C2, C3] in mm
+        c_vec: Three capacity values [C1, C2, C3] in mm, stored as a tuple
                Default AWBM2002 values: [7.5, 76.0, 152.0]
         bfi: Baseflow Index, fraction of overflow to baseflow (0-1)
         ks: Surface runoff recession constant (0-1)
         kb: Baseflow recession constant (0-1)
         a1: Partial area fraction for store 1 (default: 0.134)
         a2: Partial area fraction for store 2 (default: 0.433)
+
+    Derived attributes (computed once on construction):
+        a3: Partial area fraction for store 3 (1 - a1 - a2)
+        cap1, cap2, cap3: Store capacities scaled by area fraction (mm)
     """
-    c_vec: List[float]
+    c_vec: Sequence[float]
     bfi: float
     ks: float
     kb: float
     a1: float = 0.134
     a2: float = 0.433
-
-
-@dataclass
+    a3: float = field(init=False, repr=False)
+    cap1: float = field(init=False, repr=False)
+    cap2: float = field(init=False, repr=False)
+    cap3: float = field(init=False, repr=False)
+
+    def __post_init__(self):
+        # Frozen, so the derived values are written through object.__setattr__.
+        # c_vec is copied to a tuple so the params stay hashable and the
+        # capacities cannot go stale if the caller's list is mutated.
+        object.__setattr__(self, 'c_vec', tuple(self.c_vec))
+        a3 = 1.0 - self.a1 - self.a2
+        object.__setattr__(self, 'a3', a3)
+        object.__setattr__(self, 'cap1', self.a1 * self.c_vec[0])
+        object.__setattr__(self, 'cap2', self.a2 * self.c_vec[1])
+        object.__setattr__(self, 'cap3', a3 * self.c_vec[2])
+
+
+@dataclass(**DATACLASS_SLOTS)
 class AWBMState:
     """
     State variables for AWBM algorithm.
@@ -58,8 +81,13 @@ class AWBMState:
     s_surf: float = 0.0
     b_base: float = 0.0
 
+    @property
+    def total_storage(self) -> float:
+        """Total water held in all five stores (mm)."""
+        return self.ss1 + self.ss2 + self.ss3 + self.s_surf + self.b_base
 
-@dataclass
+
+@dataclass(**DATACLASS_SLOTS)
 class AWBMInputs:
     """
     Inputs for one AWBM timestep.
@@ -72,7 +100,7 @@ class AWBMInputs:
     pet_mm: float
 
 
-@dataclass
+@dataclass(**DATACLASS_SLOTS)
 class AWBMOutputs:
     """
     Outputs from one AWBM timestep.
@@ -89,6 +117,69 @@ class AWBMOutputs:
     surface_flow_mm: float
 
 
+def _awbm_core(
+    P: float, PET: float,
+    SS1: float, SS2: float, SS3: float, S: float, B: float,
+    A1: float, A2: float, A3: float,
+    Cap1: float, Cap2: float, Cap3: float,
+    BFI: float, Ks: float, Kb: float
+) -> Tuple[float, float, float, float, float, float, float, float, float]:
+    """
+    Compute one AWBM timestep on plain floats.
+
+    Holds the whole timestep calculation with no attribute lookups or object
+    construction, so long simulation loops can call it directly and it can be
+    handed to a compiler unchanged.
+
+    Returns:
+        Tuple of (SS1, SS2, SS3, S, B, runoff, excess, baseflow, surface_flow)
+    """
+    # --- 2. Surface Store Calculations ---
+    # Distributed P - PET for each store [mm/d], shared by overflow and update
+    Net = P - PET
+    D1 = Net * A1
+    D2 = Net * A2
+    D3 = Net * A3
+
+    # Overflow from each store (only a positive net input can overflow)
+    O1 = max(max(D1, 0.0) + (SS1 - Cap1), 0.0)
+    O2 = max(max(D2, 0.0) + (SS2 - Cap2), 0.0)
+    O3 = max(max(D3, 0.0) + (SS3 - Cap3), 0.0)
+
+    # Update surface stores
+    SS1_new = max(SS1 + (D1 - O1), 0.0)
+    SS2_new = max(SS2 + (D2 - O2), 0.0)
+    SS3_new = max(SS3 + (D3 - O3), 0.0)
+
+    # Total overflow
+    Qover = O1 + O2 + O3
+
+    # --- 3. Flow Splitting ---
+    Qi_Base = Qover * BFI
+    Qi_Surf = Qover - Qi_Base
+
+    # --- 4. Routing Store Calculations ---
+    # Using linear recession
+    if B > 0.05:
+        Qo_Base = (1.0 - Kb) * B
+    else:
+        Qo_Base = max(B, 0.0)
+
+    if S > 0.05:
+        Qo_Surf = (1.0 - Ks) * S
+    else:
+        Qo_Surf = max(S, 0.0)
+
+    # Update routing stores
+    S_new = max(S + (Qi_Surf - Qo_Surf), 0.0)
+    B_new = max(B + (Qi_Base - Qo_Base), 0.0)
+
+    # --- 5. Total Runoff ---
+    Runoff = Qo_Surf + Qo_Base
+
+    return SS1_new, SS2_new, SS3_new, S_new, B_new, Runoff, Qover, Qo_Base, Qo_Surf
+
+
 def awbm_step(
     inputs: AWBMInputs,
     params: AWBMParams,
@@ -111,54 +202,190 @@ def awbm_step(
             - new_state: Updated state variables
             - outputs: Calculated outputs for this timestep
     """
+    # Capacities are precomputed on params (see AWBMParams.__post_init__)
+    SS1, SS2, SS3, S, B, Runoff, Qover, Qo_Base, Qo_Surf = _awbm_core(
+        inputs.precip_mm, inputs.pet_mm,
+        state.ss1, state.ss2, state.ss3, state.s_surf, state.b_base,
+        params.a1, params.a2, params.a3, params.cap1, params.cap2, params.cap3,
+        params.bfi, params.ks, params.kb
+    )
+
+    # --- 6. Package Outputs ---
+    new_state = AWBMState(
+        ss1=SS1,
+        ss2=SS2,
+        ss3=SS3,
+        s_surf=S,
+        b_base=B
+    )
+
+    outputs = AWBMOutputs(
+        runoff_mm=Runoff,
+        excess_mm=Qover,
+        baseflow_mm=Qo_Base,
+        surface_flow_mm=Qo_Surf
+    )
+
+    return new_state, outputs
+
+
+def awbm_step_into(
+    inputs: AWBMInputs,
+    params: AWBMParams,
+    state: AWBMState,
+    out_state: AWBMState,
+    out_outputs: AWBMOutputs
+) -> None:
+    """
+    Execute one timestep of AWBM algorithm into caller-owned objects.
+
+    Same calculation as awbm_step, but instead of allocating a new state and
+    outputs every call it overwrites the fields of out_state and out_outputs.
+    Everything is computed before anything is written, so out_state may be
+    the same object as state to advance the state in place.
+
+    Args:
+        inputs: Current timestep inputs (precipitation, PET)
+        params: Fixed model parameters
+        state: Current state variables
+        out_state: Receives the updated state variables
+        out_outputs: Receives the calculated outputs for this timestep
+    """
+    (
+        out_state.ss1, out_state.ss2, out_state.ss3, out_state.s_surf, out_state.b_base,
+        out_outputs.runoff_mm, out_outputs.excess_mm,
+        out_outputs.baseflow_mm, out_outputs.surface_flow_mm
+    ) = _awbm_core(
+        inputs.precip_mm, inputs.pet_mm,
+        state.ss1, state.ss2, state.ss3, state.s_surf, state.b_base,
+        params.a1, params.a2, params.a3, params.cap1, params.cap2, params.cap3,
+        params.bfi, params.ks, params.kb
+    )
+
+
+def awbm_run_series(
+    precip_mm: np.ndarray,
+    pet_mm: np.ndarray,
+    params: AWBMParams,
+    state: AWBMState
+) -> Tuple[AWBMState, AWBMOutputs]:
+    """
+    Run AWBM algorithm over a whole time series.
+
+    Equivalent to calling awbm_step once per timestep, but the state is
+    carried in local floats and fed straight to the timestep core, so no
+    per-step dataclasses are created.
+
+    Args:
+        precip_mm: Precipitation for each timestep (mm), 1-D
+        pet_mm: Potential evapotranspiration for each timestep (mm), 1-D
+        params: Fixed model parameters
+        state: State variables before the first timestep
+
+    Returns:
+        Tuple of (final_state, outputs) where outputs holds one float64
+        array per field, indexed by timestep
+
+    Raises:
+        ValueError: If precip_mm and pet_mm are not 1-D arrays of equal length
+    """
+    precip = np.asarray(precip_mm, dtype=np.float64)
+    pet = np.asarray(pet_mm, dtype=np.float64)
+    if precip.ndim != 1 or precip.shape != pet.shape:
+        raise ValueError(
+            f"precip_mm and pet_mm must be 1-D and equal length, "
+            f"got shapes {precip.shape} and {pet.shape}"
+        )
+
+    SS1, SS2, SS3, S, B = state.ss1, state.ss2, state.ss3, state.s_surf, state.b_base
+    A1, A2, A3 = params.a1, params.a2, params.a3
+    Cap1, Cap2, Cap3 = params.cap1, params.cap2, params.cap3
+    BFI, Ks, Kb = params.bfi, params.ks, params.kb
+
+    rows = []
+    for P, PET in zip(precip.tolist(), pet.tolist()):
+        SS1, SS2, SS3, S, B, *flows = _awbm_core(
+            P, PET, SS1, SS2, SS3, S, B,
+            A1, A2, A3, Cap1, Cap2, Cap3, BFI, Ks, Kb
+        )
+        rows.append(flows)
+
+    Runoff, Qover, Qo_Base, Qo_Surf = np.array(rows, dtype=np.float64).reshape(-1, 4).T
+
+    final_state = AWBMState(ss1=SS1, ss2=SS2, ss3=SS3, s_surf=S, b_base=B)
+    outputs = AWBMOutputs(
+        runoff_mm=Runoff,
+        excess_mm=Qover,
+        baseflow_mm=Qo_Base,
+        surface_flow_mm=Qo_Surf
+    )
+
+    return final_state, outputs
+
+
+def awbm_step_batch(
+    inputs: AWBMInputs,
+    params: AWBMParams,
+    state: AWBMState,
+    dtype: np.dtype = np.float64
+) -> Tuple[AWBMState, AWBMOutputs]:
+    """
+    Execute one timestep of AWBM algorithm for many catchments at once.
+
+    Vectorized counterpart of awbm_step for calibration, Monte Carlo and
+    multi-catchment runs. Every field of inputs, params and state (including
+    each entry of params.c_vec) may be a NumPy array or a scalar; they are
+    broadcast against each other, so one call advances every catchment or
+    parameter sample by one timestep. Element for element, the float64
+    results match awbm_step.
+
+    Args:
+        inputs: Current timestep inputs, one value or array per field
+        params: Fixed model parameters, one value or array per field; array
+                fields should already have the requested dtype
+        state: Current state variables, one value or array per field
+        dtype: Floating point type to compute in. np.float32 halves memory
+               traffic for large ensembles at about 1e-6 relative precision.
+
+    Returns:
+        Tuple of (new_state, outputs) whose fields are arrays of dtype
+    """
     # Extract inputs
-    P = inputs.precip_mm
-    PET = inputs.pet_mm
+    P = np.asarray(inputs.precip_mm, dtype=dtype)
+    PET = np.asarray(inputs.pet_mm, dtype=dtype)
 
     # Extract state
-    SS1 = state.ss1
-    SS2 = state.ss2
-    SS3 = state.ss3
-    S = state.s_surf
-    B = state.b_base
+    SS1 = np.asarray(state.ss1, dtype=dtype)
+    SS2 = np.asarray(state.ss2, dtype=dtype)
+    SS3 = np.asarray(state.ss3, dtype=dtype)
+    S = np.asarray(state.s_surf, dtype=dtype)
+    B = np.asarray(state.b_base, dtype=dtype)
 
     # Extract parameters
-    C1, C2, C3 = params.c_vec[0], params.c_vec[1], params.c_vec[2]
     BFI = params.bfi
     Ks = params.ks
     Kb = params.kb
-    A1 = params.a1
-    A2 = params.a2
-    A3 = 1.0 - A1 - A2
+    A1, A2, A3 = params.a1, params.a2, params.a3
 
-    # --- 1. Calculate Capacities (Scaled by Area Fraction) ---
-    Cap1 = A1 * C1
-    Cap2 = A2 * C2
-    Cap3 = A3 * C3
+    # --- 1. Capacities (Scaled by Area Fraction), precomputed on params ---
+    Cap1, Cap2, Cap3 = params.cap1, params.cap2, params.cap3
 
     # --- 2. Surface Store Calculations ---
-    # Distributed P and PET [mm/d]
-    P1 = P * A1
-    P2 = P * A2
-    P3 = P * A3
-    PET1 = PET * A1
-    PET2 = PET * A2
-    PET3 = PET * A3
-
-    # Net input to each store (after ET)
-    Qin1 = max(P1 - PET1, 0.0)
-    Qin2 = max(P2 - PET2, 0.0)
-    Qin3 = max(P3 - PET3, 0.0)
-
-    # Overflow from each store
-    O1 = max(Qin1 + (SS1 - Cap1), 0.0)
-    O2 = max(Qin2 + (SS2 - Cap2), 0.0)
-    O3 = max(Qin3 + (SS3 - Cap3), 0.0)
+    # Distributed P - PET for each store [mm/d], shared by overflow and update
+    Net = P - PET
+    D1 = Net * A1
+    D2 = Net * A2
+    D3 = Net * A3
+
+    # Overflow from each store (only a positive net input can overflow)
+    O1 = np.maximum(np.maximum(D1, 0.0) + (SS1 - Cap1), 0.0)
+    O2 = np.maximum(np.maximum(D2, 0.0) + (SS2 - Cap2), 0.0)
+    O3 = np.maximum(np.maximum(D3, 0.0) + (SS3 - Cap3), 0.0)
 
     # Update surface stores
-    SS1_new = max(SS1 + (P1 - PET1 - O1), 0.0)
-    SS2_new = max(SS2 + (P2 - PET2 - O2), 0.0)
-    SS3_new = max(SS3 + (P3 - PET3 - O3), 0.0)
+    SS1_new = np.maximum(SS1 + (D1 - O1), 0.0)
+    SS2_new = np.maximum(SS2 + (D2 - O2), 0.0)
+    SS3_new = np.maximum(SS3 + (D3 - O3), 0.0)
 
     # Total overflow
     Qover = O1 + O2 + O3
@@ -168,20 +395,13 @@ def awbm_step(
     Qi_Surf = Qover - Qi_Base
 
     # --- 4. Routing Store Calculations ---
-    # Using linear recession
-    if B > 0.05:
-        Qo_Base = (1.0 - Kb) * B
-    else:
-        Qo_Base = max(B, 0.0)
-
-    if S > 0.05:
-        Qo_Surf = (1.0 - Ks) * S
-    else:
-        Qo_Surf = max(S, 0.0)
+    # Using linear recession; stores at or below 0.05 mm drain completely
+    Qo_Base = np.where(B > 0.05, (1.0 - Kb) * B, np.maximum(B, 0.0))
+    Qo_Surf = np.where(S > 0.05, (1.0 - Ks) * S, np.maximum(S, 0.0))
 
     # Update routing stores
-    S_new = max(S + (Qi_Surf - Qo_Surf), 0.0)
-    B_new = max(B + (Qi_Base - Qo_Base), 0.0)
+    S_new = np.maximum(S + (Qi_Surf - Qo_Surf), 0.0)
+    B_new = np.maximum(B + (Qi_Base - Qo_Base), 0.0)
 
     # --- 5. Total Runoff ---
     Runoff = Qo_Surf + Qo_Base
@@ -203,3 +423,153 @@ def awbm_step(
     )
 
     return new_state, outputs
+
+
+def _stack_params(param_sets: Sequence[AWBMParams], dtype: np.dtype = np.float64) -> AWBMParams:
+    """Combine parameter sets into one AWBMParams with an array per field."""
+    return AWBMParams(
+        c_vec=[np.array([p.c_vec[i] for p in param_sets], dtype=dtype) for i in range(3)],
+        bfi=np.array([p.bfi for p in param_sets], dtype=dtype),
+        ks=np.array([p.ks for p in param_sets], dtype=dtype),
+        kb=np.array([p.kb for p in param_sets], dtype=dtype),
+        a1=np.array([p.a1 for p in param_sets], dtype=dtype),
+        a2=np.array([p.a2 for p in param_sets], dtype=dtype)
+    )
+
+
+def _prepare_ensemble(
+    precip_mm: np.ndarray,
+    pet_mm: np.ndarray,
+    param_sets: Sequence[AWBMParams],
+    dtype: np.dtype
+) -> Tuple[np.ndarray, np.ndarray, AWBMParams]:
+    """Validate ensemble forcing and stack the parameter sets."""
+    if not param_sets:
+        raise ValueError("param_sets must contain at least one parameter set")
+
+    precip = np.asarray(precip_mm, dtype=dtype)
+    pet = np.asarray(pet_mm, dtype=dtype)
+    if precip.ndim not in (1, 2) or precip.shape != pet.shape:
+        raise ValueError(
+            f"precip_mm and pet_mm must both be (T,) or (T, N), "
+            f"got shapes {precip.shape} and {pet.shape}"
+        )
+
+    return precip, pet, _stack_params(param_sets, dtype)
+
+
+def _run_ensemble_block(
+    precip: np.ndarray,
+    pet: np.ndarray,
+    params: AWBMParams,
+    state: AWBMState,
+    n_members: int,
+    dtype: np.dtype
+) -> Tuple[AWBMState, AWBMOutputs]:
+    """Advance an ensemble through every timestep of precip and pet."""
+    shape = (precip.shape[0], n_members)
+    runoff = np.empty(shape, dtype=dtype)
+    excess = np.empty(shape, dtype=dtype)
+    baseflow = np.empty(shape, dtype=dtype)
+    surface_flow = np.empty(shape, dtype=dtype)
+
+    for t in range(shape[0]):
+        state, step_outputs = awbm_step_batch(
+            AWBMInputs(precip_mm=precip[t], pet_mm=pet[t]), params, state, dtype
+        )
+        runoff[t] = step_outputs.runoff_mm
+        excess[t] = step_outputs.excess_mm
+        baseflow[t] = step_outputs.baseflow_mm
+        surface_flow[t] = step_outputs.surface_flow_mm
+
+    outputs = AWBMOutputs(
+        runoff_mm=runoff,
+        excess_mm=excess,
+        baseflow_mm=baseflow,
+        surface_flow_mm=surface_flow
+    )
+
+    return state, outputs
+
+
+def awbm_run_ensemble(
+    precip_mm: np.ndarray,
+    pet_mm: np.ndarray,
+    param_sets: Sequence[AWBMParams],
+    state: AWBMState,
+    dtype: np.dtype = np.float64
+) -> Tuple[AWBMState, AWBMOutputs]:
+    """
+    Run AWBM algorithm over a time series for an ensemble of parameter sets.
+
+    Intended for Monte Carlo calibration, where every sample is independent.
+    All ensemble members advance together through awbm_step_batch, so each
+    timestep is a handful of NumPy operations across the whole ensemble
+    rather than one Python call per member.
+
+    Args:
+        precip_mm: Precipitation (mm), shape (T,) shared by all members or
+                   (T, N) with one column per member
+        pet_mm: Potential evapotranspiration (mm), same shape as precip_mm
+        param_sets: N parameter sets, one per ensemble member
+        state: Initial state, scalar fields shared by all members or
+               arrays of shape (N,)
+        dtype: Floating point type to compute and store results in.
+               np.float32 halves the memory of large ensembles at about
+               1e-6 relative precision; daily depths in mm need far less.
+
+    Returns:
+        Tuple of (final_state, outputs) where final_state fields have shape
+        (N,) and outputs fields are dtype arrays of shape (T, N)
+
+    Raises:
+        ValueError: If param_sets is empty or the forcing shapes do not match
+    """
+    precip, pet, params = _prepare_ensemble(precip_mm, pet_mm, param_sets, dtype)
+    return _run_ensemble_block(precip, pet, params, state, len(param_sets), dtype)
+
+
+def awbm_iter_ensemble(
+    precip_mm: np.ndarray,
+    pet_mm: np.ndarray,
+    param_sets: Sequence[AWBMParams],
+    state: AWBMState,
+    time_batch: int = 365,
+    dtype: np.dtype = np.float64
+) -> Iterator[Tuple[int, AWBMState, AWBMOutputs]]:
+    """
+    Run an AWBM ensemble in blocks of timesteps, yielding each block's outputs.
+
+    Same simulation as awbm_run_ensemble, but outputs are produced
+    time_batch timesteps at a time instead of as one (T, N) array, so
+    long multi-member runs can be aggregated or written out block by block
+    with memory bounded by time_batch * N per output field. Pick time_batch
+    so a block of outputs stays cache-sized for the ensemble at hand.
+
+    Args:
+        precip_mm: Precipitation (mm), shape (T,) or (T, N)
+        pet_mm: Potential evapotranspiration (mm), same shape as precip_mm
+        param_sets: N parameter sets, one per ensemble member
+        state: Initial state, scalar fields or arrays of shape (N,)
+        time_batch: Number of timesteps per yielded block
+        dtype: Floating point type to compute and store results in
+
+    Yields:
+        Tuples of (t0, state, outputs) where outputs fields have shape
+        (n, N) for timesteps t0 to t0 + n - 1, and state is the ensemble
+        state after the block
+
+    Raises:
+        ValueError: If time_batch is not positive, param_sets is empty or the
+            forcing shapes do not match
+    """
+    if time_batch < 1:
+        raise ValueError(f"time_batch must be positive, got {time_batch}")
+    precip, pet, params = _prepare_ensemble(precip_mm, pet_mm, param_sets, dtype)
+
+    for t0 in range(0, precip.shape[0], time_batch):
+        block = slice(t0, t0 + time_batch)
+        state, outputs = _run_ensemble_block(
+            precip[block], pet[block], params, state, len(param_sets), dtype
+        )
+        yield t0, state, outputs
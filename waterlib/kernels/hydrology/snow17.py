@@ -16,8 +16,12 @@ from dataclasses import dataclass
 from typing import Tuple
 import math
 
+import numpy as np
 
-@dataclass
+from waterlib.kernels._compat import DATACLASS_SLOTS
+
+
+@dataclass(frozen=True, **DATACLASS_SLOTS)
 class Snow17Params:
     """
     Fixed parameters for Snow17 algorithm.
@@ -48,7 +52,7 @@ class Snow17Params:
     lapse_rate: float = 0.006
 
 
-@dataclass
+@dataclass(**DATACLASS_SLOTS)
 class Snow17State:
     """
     State variables for Snow17 algorithm.
@@ -65,7 +69,7 @@ class Snow17State:
     deficit: float = 0.0
 
 
-@dataclass
+@dataclass(**DATACLASS_SLOTS)
 class Snow17Inputs:
     """
     Inputs for one Snow17 timestep.
@@ -90,7 +94,7 @@ class Snow17Inputs:
     latitude: float = 45.0
 
 
-@dataclass
+@dataclass(**DATACLASS_SLOTS)
 class Snow17Outputs:
     """
     Outputs from one Snow17 timestep.
@@ -107,48 +111,37 @@ class Snow17Outputs:
     snow_mm: float
 
 
-def snow17_step(
-    inputs: Snow17Inputs,
-    params: Snow17Params,
-    state: Snow17State
-) -> Tuple[Snow17State, Snow17Outputs]:
+def _snow17_core(
+    temp_c: float, precip_mm: float, elevation_m: float, ref_elevation_m: float,
+    day_of_year: int, days_in_year: int, dt_hours: float, latitude: float,
+    mfmax: float, mfmin: float, mbase: float, pxtemp1: float, pxtemp2: float,
+    scf: float, nmf: float, plwhc: float, uadj: float, tipm: float, lapse_rate: float,
+    w_i: float, w_q: float, ait: float, deficit: float
+) -> Tuple[float, float, float, float, float, float, float, float]:
     """
-    Execute one timestep of Snow17 algorithm.
-
-    Pure function with no side effects. Calculates snow accumulation, melt,
-    and liquid water movement through the snowpack.
+    Compute one Snow17 timestep on plain floats.
 
-    Args:
-        inputs: Current timestep inputs (temperature, precipitation, etc.)
-        params: Fixed model parameters
-        state: Current state variables
+    snow17_step unpacks its dataclasses into this function; callers that keep
+    zone inputs and state as raw floats can skip the wrappers altogether.
 
     Returns:
-        Tuple of (new_state, outputs) where:
-            - new_state: Updated state variables
-            - outputs: Calculated outputs for this timestep
+        Tuple of (w_i, w_q, ait, deficit, runoff, swe, rain, snow)
     """
-    # Extract state variables
-    w_i = state.w_i
-    w_q = state.w_q
-    ait = state.ait
-    deficit = state.deficit
-
     # Calculate timestep intervals
-    dt_6hr_intervals = inputs.dt_hours / 6.0
+    dt_6hr_intervals = dt_hours / 6.0
 
     # --- 1. Adjust Temperature for Elevation ---
-    altitude_adj = params.lapse_rate * (inputs.ref_elevation_m - inputs.elevation_m)
-    t_air_mean = inputs.temp_c + altitude_adj
+    altitude_adj = lapse_rate * (ref_elevation_m - elevation_m)
+    t_air_mean = temp_c + altitude_adj
 
     # --- 2. Partition Rain / Snow ---
     frac_snow = _interpolate_temperature(
-        t_air_mean, params.pxtemp1, params.pxtemp2, 1.0, 0.0
+        t_air_mean, pxtemp1, pxtemp2, 1.0, 0.0
     )
     frac_rain = 1.0 - frac_snow
 
-    rain = frac_rain * inputs.precip_mm
-    pn = frac_snow * inputs.precip_mm * params.scf  # Water equivalent of new snow
+    rain = frac_rain * precip_mm
+    pn = frac_snow * precip_mm * scf  # Water equivalent of new snow
 
     # Update ice storage with new snow
     w_i += pn
@@ -160,7 +153,7 @@ def snow17_step(
     delta_hd_snow = -(t_snow_new * pn) / 160.0
 
     # Update ATI (Antecedent Temperature Index)
-    tipm_dt = 1.0 - math.pow(1.0 - params.tipm, dt_6hr_intervals)
+    tipm_dt = 1.0 - math.pow(1.0 - tipm, dt_6hr_intervals)
 
     # If significant new snow, ATI resets to new snow temp
     timestep_threshold = 1.5 * dt_6hr_intervals
@@ -174,30 +167,30 @@ def snow17_step(
 
     # Calculate Melt Factor
     mf = _calculate_melt_factor(
-        inputs.day_of_year, inputs.days_in_year, inputs.latitude,
-        params.mfmax, params.mfmin, dt_6hr_intervals
+        day_of_year, days_in_year, latitude,
+        mfmax, mfmin, dt_6hr_intervals
     )
 
     # Heat deficit change from temperature gradient
-    delta_hd_t = params.nmf * dt_6hr_intervals * (mf / params.mfmax) * (ait - t_snow_new)
+    delta_hd_t = nmf * dt_6hr_intervals * (mf / mfmax) * (ait - t_snow_new)
     delta_hd_t = max(-10.0, min(delta_hd_t, 10.0))  # Clamp for stability
 
     # --- 4. Melt Calculation ---
     melt = 0.0
 
-    if t_air_mean > params.mbase:
+    if t_air_mean > mbase:
         # Check for Rain-on-Snow (ROS) conditions
-        is_rain = (rain > 0.25 * inputs.dt_hours) and (t_air_mean > 0.0)
+        is_rain = (rain > 0.25 * dt_hours) and (t_air_mean > 0.0)
 
         if is_rain:
             melt = _calculate_rain_on_snow_melt(
-                t_air_mean, rain, inputs.elevation_m,
-                inputs.dt_hours, dt_6hr_intervals, params.uadj
+                t_air_mean, rain, elevation_m,
+                dt_hours, dt_6hr_intervals, uadj
             )
         else:
             # Regular Temperature Index Melt
-            t_rain_energy = max(max(t_air_mean, params.pxtemp1), 0.0)
-            melt = (mf * (t_air_mean - params.mbase)) + (0.0125 * rain * t_rain_energy)
+            t_rain_energy = max(max(t_air_mean, pxtemp1), 0.0)
+            melt = (mf * (t_air_mean - mbase)) + (0.0125 * rain * t_rain_energy)
 
         melt = max(melt, 0.0)
 
@@ -210,7 +203,7 @@ def snow17_step(
     qw = melt + rain
 
     # Liquid Water Capacity
-    w_qx = params.plwhc * w_i
+    w_qx = plwhc * w_i
 
     # Update Heat Deficit
     deficit += delta_hd_snow + delta_hd_t
@@ -220,7 +213,7 @@ def snow17_step(
     excess_melt = 0.0
 
     if w_i + w_q > 0.0:  # Snowpack exists
-        water_demand_to_ripen = (deficit * (1.0 + params.plwhc)) + w_qx
+        water_demand_to_ripen = (deficit * (1.0 + plwhc)) + w_qx
         current_liquid_plus_new = w_q + qw
 
         if current_liquid_plus_new > water_demand_to_ripen:
@@ -255,6 +248,38 @@ def snow17_step(
     # --- 7. Calculate Outputs ---
     swe = w_i + w_q
 
+    return w_i, w_q, ait, deficit, excess_melt, swe, rain, pn
+
+
+def snow17_step(
+    inputs: Snow17Inputs,
+    params: Snow17Params,
+    state: Snow17State
+) -> Tuple[Snow17State, Snow17Outputs]:
+    """
+    Execute one timestep of Snow17 algorithm.
+
+    Pure function with no side effects. Calculates snow accumulation, melt,
+    and liquid water movement through the snowpack.
+
+    Args:
+        inputs: Current timestep inputs (temperature, precipitation, etc.)
+        params: Fixed model parameters
+        state: Current state variables
+
+    Returns:
+        Tuple of (new_state, outputs) where:
+            - new_state: Updated state variables
+            - outputs: Calculated outputs for this timestep
+    """
+    w_i, w_q, ait, deficit, excess_melt, swe, rain, pn = _snow17_core(
+        inputs.temp_c, inputs.precip_mm, inputs.elevation_m, inputs.ref_elevation_m,
+        inputs.day_of_year, inputs.days_in_year, inputs.dt_hours, inputs.latitude,
+        params.mfmax, params.mfmin, params.mbase, params.pxtemp1, params.pxtemp2,
+        params.scf, params.nmf, params.plwhc, params.uadj, params.tipm, params.lapse_rate,
+        state.w_i, state.w_q, state.ait, state.deficit
+    )
+
     new_state = Snow17State(
         w_i=w_i,
         w_q=w_q,
@@ -272,6 +297,157 @@ def snow17_step(
     return new_state, outputs
 
 
+def snow17_step_batch(
+    inputs: Snow17Inputs,
+    params: Snow17Params,
+    state: Snow17State
+) -> Tuple[Snow17State, Snow17Outputs]:
+    """
+    Execute one timestep of Snow17 algorithm for many zones at once.
+
+    Vectorized counterpart of snow17_step for elevation bands, parameter
+    sweeps and ensembles. Every field of inputs, params and state may be a
+    NumPy array or a scalar; they are broadcast against each other and each
+    branch of the scalar algorithm becomes an np.where selection, so one call
+    advances every zone by one timestep. Element for element, the results
+    match snow17_step.
+
+    Args:
+        inputs: Current timestep inputs, one value or array per field
+        params: Fixed model parameters, one value or array per field
+        state: Current state variables, one value or array per field
+
+    Returns:
+        Tuple of (new_state, outputs) whose fields are float64 arrays
+    """
+    # Extract state variables
+    w_i = np.asarray(state.w_i, dtype=np.float64)
+    w_q = np.asarray(state.w_q, dtype=np.float64)
+    ait = np.asarray(state.ait, dtype=np.float64)
+    deficit = np.asarray(state.deficit, dtype=np.float64)
+
+    precip = np.asarray(inputs.precip_mm, dtype=np.float64)
+    dt_hours = np.asarray(inputs.dt_hours, dtype=np.float64)
+
+    # Calculate timestep intervals
+    dt_6hr_intervals = dt_hours / 6.0
+
+    # --- 1. Adjust Temperature for Elevation ---
+    altitude_adj = params.lapse_rate * (
+        np.asarray(inputs.ref_elevation_m, dtype=np.float64) - inputs.elevation_m
+    )
+    t_air_mean = inputs.temp_c + altitude_adj
+
+    # --- 2. Partition Rain / Snow ---
+    # Same interpolation as _interpolate_temperature; the ramp is only kept
+    # strictly between the thresholds, so pxtemp1 == pxtemp2 is safe
+    with np.errstate(divide='ignore', invalid='ignore'):
+        ramp = 1.0 - (t_air_mean - params.pxtemp1) / (params.pxtemp2 - params.pxtemp1)
+    frac_snow = np.where(
+        t_air_mean <= params.pxtemp1, 1.0,
+        np.where(t_air_mean >= params.pxtemp2, 0.0, ramp)
+    )
+    frac_rain = 1.0 - frac_snow
+
+    rain = frac_rain * precip
+    pn = frac_snow * precip * params.scf  # Water equivalent of new snow
+
+    # Update ice storage with new snow
+    w_i = w_i + pn
+
+    # --- 3. Energy Exchange (ATI & Heat Deficit) ---
+    t_snow_new = np.minimum(t_air_mean, 0.0)
+
+    # Heat deficit from new snow
+    delta_hd_snow = -(t_snow_new * pn) / 160.0
+
+    # Update ATI; significant new snow resets it to the new snow temperature
+    tipm_dt = 1.0 - np.power(1.0 - np.asarray(params.tipm, dtype=np.float64), dt_6hr_intervals)
+    timestep_threshold = 1.5 * dt_6hr_intervals
+
+    ait = np.where(pn > timestep_threshold, t_snow_new, ait + tipm_dt * (t_air_mean - ait))
+    ait = np.minimum(ait, 0.0)  # ATI cannot be > 0
+
+    # Calculate Melt Factor
+    mf = _calculate_melt_factor_vec(
+        inputs.day_of_year, inputs.days_in_year, inputs.latitude,
+        params.mfmax, params.mfmin, dt_6hr_intervals
+    )
+
+    # Heat deficit change from temperature gradient, clamped for stability
+    delta_hd_t = params.nmf * dt_6hr_intervals * (mf / params.mfmax) * (ait - t_snow_new)
+    delta_hd_t = np.maximum(-10.0, np.minimum(delta_hd_t, 10.0))
+
+    # --- 4. Melt Calculation ---
+    # Rain-on-snow energy balance or regular temperature index melt
+    is_rain = (rain > 0.25 * dt_hours) & (t_air_mean > 0.0)
+    ros_melt = _calculate_rain_on_snow_melt_vec(
+        t_air_mean, rain, inputs.elevation_m,
+        dt_hours, dt_6hr_intervals, params.uadj
+    )
+    t_rain_energy = np.maximum(np.maximum(t_air_mean, params.pxtemp1), 0.0)
+    ti_melt = (mf * (t_air_mean - params.mbase)) + (0.0125 * rain * t_rain_energy)
+
+    melt = np.where(is_rain, ros_melt, ti_melt)
+    melt = np.where(t_air_mean > params.mbase, np.maximum(melt, 0.0), 0.0)
+
+    # --- 5. Apply Melt and Liquid Water Balance ---
+    melt = np.minimum(w_i, melt)
+    w_i = w_i - melt
+
+    # Total Liquid Water Available
+    qw = melt + rain
+
+    # Liquid Water Capacity
+    w_qx = params.plwhc * w_i
+
+    # Update Heat Deficit
+    deficit = deficit + (delta_hd_snow + delta_hd_t)
+    deficit = np.maximum(0.0, np.minimum(deficit, 0.33 * w_i))
+
+    # --- 6. Ripeness and Excess Water (Runoff) ---
+    water_demand_to_ripen = (deficit * (1.0 + params.plwhc)) + w_qx
+    current_liquid_plus_new = w_q + qw
+
+    pack = w_i + w_q > 0.0
+    super_ripe = pack & (current_liquid_plus_new > water_demand_to_ripen)
+    ripening = pack & ~super_ripe & (current_liquid_plus_new >= deficit)
+    cold = pack & ~super_ripe & ~ripening
+    warm = super_ripe | ripening
+
+    # Bare ground passes all input through; only a super-ripe pack spills
+    excess_melt = np.where(
+        super_ripe, current_liquid_plus_new - water_demand_to_ripen,
+        np.where(pack, 0.0, qw + w_q)
+    )
+    w_q_new = np.where(
+        super_ripe, w_qx,
+        np.where(ripening, w_q + qw - deficit, np.where(cold, w_q, 0.0))
+    )
+    w_i_new = np.where(warm, w_i + deficit, np.where(cold, w_i + qw, 0.0))
+    deficit_new = np.where(cold, deficit - qw, 0.0)
+
+    # If deficit is 0, ATI should be 0 (isothermal)
+    ait = np.where(deficit_new == 0.0, 0.0, ait)
+
+    # --- 7. Calculate Outputs ---
+    new_state = Snow17State(
+        w_i=w_i_new,
+        w_q=w_q_new,
+        ait=ait,
+        deficit=deficit_new
+    )
+
+    outputs = Snow17Outputs(
+        runoff_mm=excess_melt,
+        swe_mm=w_i_new + w_q_new,
+        rain_mm=rain,
+        snow_mm=pn
+    )
+
+    return new_state, outputs
+
+
 # --- Helper Functions ---
 
 def _interpolate_temperature(
@@ -345,6 +521,37 @@ def _calculate_melt_factor(
     return dt_6hr_intervals * ((sv * av * (mfmax - mfmin)) + mfmin)
 
 
+def _calculate_melt_factor_vec(
+    day_of_year: np.ndarray,
+    days_in_year: np.ndarray,
+    lat: np.ndarray,
+    mfmax: np.ndarray,
+    mfmin: np.ndarray,
+    dt_6hr_intervals: np.ndarray
+) -> np.ndarray:
+    """
+    Vectorized counterpart of _calculate_melt_factor; arguments broadcast.
+
+    Returns:
+        Melt factor for this timestep, one value per element
+    """
+    doy = np.asarray(day_of_year)
+
+    # Seasonality based on sine wave peaking June 21 (approx day 172)
+    n = doy - 80
+    sv = 0.5 * np.sin((n * 2.0 * math.pi) / days_in_year) + 0.5
+
+    # Latitude adjustment for high latitudes
+    av_high = np.select(
+        [doy <= 78, doy <= 116, doy <= 228, doy <= 266],
+        [0.0, (doy - 78.0) / 38.0, 1.0, 1.0 - (doy - 228.0) / 38.0],
+        default=0.0
+    )
+    av = np.where(np.asarray(lat) >= 54.0, av_high, 1.0)
+
+    return dt_6hr_intervals * ((sv * av * (mfmax - mfmin)) + mfmin)
+
+
 def _calculate_rain_on_snow_melt(
     t_air: float,
     rain: float,
@@ -392,6 +599,43 @@ def _calculate_rain_on_snow_melt(
     return max(m_ros1, 0.0) + max(m_ros2, 0.0) + max(m_ros3, 0.0)
 
 
+def _calculate_rain_on_snow_melt_vec(
+    t_air: np.ndarray,
+    rain: np.ndarray,
+    elev: np.ndarray,
+    dt_hours: np.ndarray,
+    dt_6hr_int: np.ndarray,
+    uadj: np.ndarray
+) -> np.ndarray:
+    """
+    Vectorized counterpart of _calculate_rain_on_snow_melt; arguments broadcast.
+
+    Returns:
+        Melt amount (mm), one value per element
+    """
+    t_k = t_air + 273.15
+
+    # 1. Longwave Radiation Exchange (Stefan-Boltzmann)
+    sigma = 6.12e-10
+    m_ros1 = sigma * dt_hours * (np.power(t_k, 4.0) - math.pow(273.15, 4.0))
+
+    # 2. Heat from Rain Advection
+    t_rain = np.maximum(t_air, 0.0)
+    m_ros2 = 0.0125 * rain * t_rain
+
+    # 3. Turbulent Transfer; invalid elements are only ever discarded by the
+    # caller's np.where, so silence their warnings
+    with np.errstate(invalid='ignore', divide='ignore', over='ignore'):
+        elev_100m = np.asarray(elev, dtype=np.float64) / 100.0
+        p_atm = 33.86 * (29.9 - (0.335 * elev_100m) + (0.00022 * np.power(elev_100m, 2.4)))
+        e_sat = 2.7489e8 * np.exp(-4278.63 / (t_air + 242.792))
+
+    term3 = (0.9 * e_sat - 6.11) + (0.00057 * p_atm * t_air)
+    m_ros3 = 8.5 * uadj * dt_6hr_int * term3
+
+    return np.maximum(m_ros1, 0.0) + np.maximum(m_ros2, 0.0) + np.maximum(m_ros3, 0.0)
+
+
 def _calculate_atm_pressure(elev: float) -> float:
     """
     Calculate atmospheric pressure (mb) based on elevation (m).